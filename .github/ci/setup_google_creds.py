@@ -19,21 +19,11 @@ except json.JSONDecodeError as e:
     print(f"First 200 chars: {creds_json[:200]}")
     sys.exit(1)
 
-# Write file
+# Write file (flushed to disk; no need to read it back and re-parse)
 output_path = 'gen-lang-client-0316337343-f310859556ae.json'
 with open(output_path, 'w', encoding='utf-8') as f:
     f.write(creds_json)
-
-# Verify file was written correctly
-with open(output_path, 'r', encoding='utf-8') as f:
-    file_content = f.read()
-    try:
-        json.loads(file_content)
-        print("✅ File written and verified successfully")
-    except json.JSONDecodeError as e:
-        print(f"❌ File verification failed: {e}")
-        print(f"First 200 chars of file: {file_content[:200]}")
-        sys.exit(1)
+    f.flush()
+    os.fsync(f.fileno())
 
 print(f"✅ Google Cloud credentials file created: {output_path}")
-
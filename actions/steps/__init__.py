@@ -2,7 +2,7 @@
 
 from .step1_check_pdfs import check_for_new_pdfs
 from .step2_download_pdfs import download_new_pdfs
-from .step3_extract_charts import extract_chart_pages
+from .step3_extract_charts import create_extraction_pool, submit_chart_extraction, extract_chart_pages
 from .step4_process_images import process_chart_images
 from .step5_upload_cloud import upload_results_to_cloud
 from .step6_generate_plot import generate_pe_ratio_plot
@@ -10,6 +10,8 @@ from .step6_generate_plot import generate_pe_ratio_plot
 __all__ = [
     'check_for_new_pdfs',
     'download_new_pdfs',
+    'create_extraction_pool',
+    'submit_chart_extraction',
     'extract_chart_pages',
     'process_chart_images',
     'upload_results_to_cloud',
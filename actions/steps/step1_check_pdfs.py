@@ -4,8 +4,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
 
-from src.factset_report_analyzer.utils import list_cloud_files
-from src.factset_report_analyzer.utils.cloudflare import read_csv_from_cloud
+from src.factset_report_analyzer.utils import get_last_date_from_csv, list_cloud_files, read_json_from_cloud
+
+# Small object holding the latest PDF date in cloud (updated in Step 5)
+LATEST_PDF_META = "meta/latest_pdf.json"
 
 
 def check_for_new_pdfs() -> tuple[datetime, set[str]]:
@@ -16,55 +18,69 @@ def check_for_new_pdfs() -> tuple[datetime, set[str]]:
         Tuple of (download_start_date, cloud_pdf_names)
         - download_start_date: Date to start downloading from
         - cloud_pdf_names: Set of PDF filenames already in cloud
+          (empty when the latest date comes from the metadata cache)
     """
     print("-" * 80)
     print(" 🔍 Step 1: Checking for new PDFs...")
     
-    # Get last date from public URL CSV
+    # Get last date from public URL CSV (rows are sorted by Report_Date,
+    # so only the tail of the file is fetched)
     last_date = None
     try:
-        df = read_csv_from_cloud("extracted_estimates.csv")
+        last_date = get_last_date_from_csv("extracted_estimates.csv", Path("extracted_estimates.csv"))
         
-        if df is not None and not df.empty and 'Report_Date' in df.columns:
-            df['Report_Date'] = pd.to_datetime(df['Report_Date'])
-            last_date = df['Report_Date'].max().to_pydatetime()
+        if last_date:
             print(f"📅 Last report date in public CSV: {last_date.strftime('%Y-%m-%d')}")
         else:
             print("ℹ️  No existing CSV data (first run)")
     except Exception as e:
         print(f"⚠️  Could not read CSV from public URL: {e}")
     
-    # Get cloud PDF list
-    cloud_pdfs = list_cloud_files('reports/')
-    cloud_pdf_names = {Path(p).name for p in cloud_pdfs}
-    print(f"📦 Found {len(cloud_pdf_names)} PDFs in cloud")
+    # Get latest cloud PDF date from metadata cache, listing the bucket only if missing
+    cloud_pdf_names: set[str] = set()
+    latest_cloud_date = _read_latest_pdf_meta()
+    if latest_cloud_date:
+        print(f"📦 Latest cloud PDF date from {LATEST_PDF_META}")
+    else:
+        # One listing per report year, fetched concurrently
+        years = range(2016, datetime.now().year + 1)
+        # Keep only basenames; the key list is not retained after this
+        cloud_pdf_names = {
+            key.rpartition('/')[2]
+            for key in list_cloud_files('reports/', shards=[f"EarningsInsight_{y}" for y in years])
+        }
+        print(f"📦 Found {len(cloud_pdf_names)} PDFs in cloud")
+        latest_cloud_date = latest_pdf_date(cloud_pdf_names)
     
     # Determine start date for download
-    download_start_date = _calculate_download_start_date(last_date, cloud_pdf_names)
+    download_start_date = _calculate_download_start_date(last_date, latest_cloud_date)
     
     return download_start_date, cloud_pdf_names
 
 
-def _calculate_download_start_date(last_date: datetime | None, cloud_pdf_names: set[str]) -> datetime:
-    """Calculate the start date for downloading PDFs."""
-    # Get latest date from cloud PDFs
-    latest_cloud_date = None
-    if cloud_pdf_names:
-        cloud_dates = []
-        for pdf_name in cloud_pdf_names:
-            try:
-                # Format: EarningsInsight_YYYYMMDD_MMDDYY.pdf
-                parts = pdf_name.replace('.pdf', '').split('_')
-                if len(parts) >= 2:
-                    date_str = parts[1]  # YYYYMMDD
-                    pdf_date = datetime.strptime(date_str, '%Y%m%d')
-                    cloud_dates.append(pdf_date)
-            except (ValueError, IndexError):
-                continue
-        
-        if cloud_dates:
-            latest_cloud_date = max(cloud_dates)
+def _read_latest_pdf_meta() -> datetime | None:
+    """Read latest cloud PDF date from the metadata cache object."""
+    meta = read_json_from_cloud(LATEST_PDF_META)
+    try:
+        return datetime.strptime(meta['latest_pdf_date'], '%Y-%m-%d')
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def latest_pdf_date(cloud_pdf_names: set[str]) -> datetime | None:
+    """Get latest report date from PDF filenames (parsed in one vectorized pass)."""
+    if not cloud_pdf_names:
+        return None
+    
+    # Format: EarningsInsight_YYYYMMDD_MMDDYY.pdf (unparseable names become NaT)
+    names = pd.Series(list(cloud_pdf_names), dtype='string')
+    dates = pd.to_datetime(names.str.extract(r'_(\d{8})_', expand=False), format='%Y%m%d', errors='coerce')
     
+    return dates.max().to_pydatetime() if dates.notna().any() else None
+
+
+def _calculate_download_start_date(last_date: datetime | None, latest_cloud_date: datetime | None) -> datetime:
+    """Calculate the start date for downloading PDFs."""
     # Use the latest date between CSV and cloud PDFs
     if last_date and latest_cloud_date:
         download_start_date = max(last_date, latest_cloud_date) + timedelta(days=1)
@@ -85,4 +101,3 @@ def _calculate_download_start_date(last_date: datetime | None, cloud_pdf_names:
         print(f"📅 No existing data found. Starting from: {download_start_date.strftime('%Y-%m-%d')}")
     
     return download_start_date
-
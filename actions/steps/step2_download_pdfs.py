@@ -1,5 +1,6 @@
 """Step 2: Download new PDFs from FactSet."""
 
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -9,7 +10,8 @@ from src.factset_report_analyzer import download_pdfs
 def download_new_pdfs(
     start_date: datetime,
     end_date: datetime,
-    skip_existing: set[str]
+    skip_existing: set[str],
+    on_download: Callable[[dict], None] | None = None
 ) -> list[dict]:
     """
     Download new PDFs from FactSet.
@@ -18,6 +20,7 @@ def download_new_pdfs(
         start_date: Start date for downloading
         end_date: End date for downloading
         skip_existing: Set of PDF filenames to skip
+        on_download: Optional callback invoked with each PDF as it arrives
         
     Returns:
         List of PDF info dicts with 'filename' and 'content' keys
@@ -29,7 +32,9 @@ def download_new_pdfs(
         start_date=start_date,
         end_date=end_date,
         rate_limit=0.05,
-        skip_existing=skip_existing
+        skip_existing=skip_existing,
+        max_workers=8,
+        on_download=on_download
     )
     
     if not pdfs:
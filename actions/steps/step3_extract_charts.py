@@ -1,25 +1,81 @@
 """Step 3: Extract EPS chart pages as PNGs from PDFs."""
 
+import multiprocessing
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
 
-from src.factset_report_analyzer import extract_charts
+# Imported once by the fork server so each worker starts with pdfplumber loaded
+_WORKER_PRELOAD = ['src.factset_report_analyzer.core.extractor']
 
 
-def extract_chart_pages(pdf_files: list[Path]) -> list[tuple[str, bytes]]:
+def create_extraction_pool() -> ProcessPoolExecutor:
     """
-    Extract EPS chart pages as PNGs from PDFs.
+    Create the process pool for chart extraction.
+    
+    Workers are forked from a single-threaded fork server that has already
+    imported the extractor, so they start warm without re-importing
+    pdfplumber. Plain fork is avoided because Step 2 download threads are
+    running while workers start. Falls back to the platform default start
+    method where forkserver is unavailable (Windows).
+    
+    Returns:
+        ProcessPoolExecutor sized to the CPU count (workers start on first submit)
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=os.cpu_count())
+    
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload(_WORKER_PRELOAD)
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=ctx)
+
+
+def submit_chart_extraction(executor: Executor, pdf_info: dict) -> Future:
+    """
+    Start extracting the EPS chart page of a downloaded PDF.
+    
+    Called as each PDF arrives in Step 2, so CPU-bound extraction overlaps
+    with the remaining network-bound downloads.
+    
+    Args:
+        executor: Executor running the extraction (a process pool)
+        pdf_info: PDF info dict with 'filename' and 'content' keys
+        
+    Returns:
+        Future resolving to (filename, image_bytes) or None
+    """
+    # Imported here: pdfplumber is only needed when there are new PDFs
+    from src.factset_report_analyzer import extract_chart
+    
+    return executor.submit(extract_chart, (pdf_info['filename'], pdf_info['content']))
+
+
+def extract_chart_pages(extractions: list[Future], directory: Path) -> list[Path]:
+    """
+    Save EPS chart pages extracted from PDFs as PNG files.
+    
+    Each chart is written as soon as its extraction finishes, so no extra
+    in-memory list of image bytes is built.
     
     Args:
-        pdf_files: List of PDF file paths
+        extractions: Futures returned by submit_chart_extraction
+        directory: Directory to write PNG files to
         
     Returns:
-        List of tuples (filename, image_bytes)
+        List of saved chart file paths
     """
     print("-" * 80)
     print(" 🖼️  Step 3: Extracting EPS chart pages...")
     
-    chart_data = extract_charts(pdf_files)
-    print(f"✅ PNG extraction complete: {len(chart_data)} charts\n")
+    chart_files = []
+    for future in extractions:
+        chart = future.result()
+        if chart is None:
+            continue
+        filename, image_bytes = chart
+        chart_path = directory / filename
+        chart_path.write_bytes(image_bytes)
+        chart_files.append(chart_path)
+    print(f"✅ PNG extraction complete: {len(chart_files)} charts\n")
     
-    return chart_data
-
+    return chart_files
@@ -3,8 +3,6 @@
 from pathlib import Path
 import pandas as pd
 
-from src.factset_report_analyzer import process_images
-
 
 def process_chart_images(directory: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -19,6 +17,9 @@ def process_chart_images(directory: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
     print("-" * 80)
     print(" 🔍 Step 4: Processing images and extracting data...")
     
+    # Imported here: OCR dependencies are only needed when there are new charts
+    from src.factset_report_analyzer import process_images
+    
     df_main, df_confidence = process_images(directory=directory)
     print(f"✅ Image processing complete: {len(df_main)} records\n")
     
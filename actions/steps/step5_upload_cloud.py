@@ -1,14 +1,27 @@
 """Step 5: Upload results to cloud storage."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
-from src.factset_report_analyzer.utils import upload_to_cloud
+from src.factset_report_analyzer.utils import (
+    upload_to_cloud,
+    upload_bytes_to_cloud,
+    read_json_from_cloud,
+    write_json_to_cloud,
+)
 from src.factset_report_analyzer.utils.cloudflare import write_csv_to_cloud
 import pandas as pd
 
+from .step1_check_pdfs import LATEST_PDF_META, latest_pdf_date
+
+# Bounded to stay clear of R2 rate limits (and within the shared S3 client's
+# connection pool, so every worker keeps a warm connection)
+MAX_UPLOAD_WORKERS = 16
+
 
 def upload_results_to_cloud(
-    pdf_files: list[Path],
+    pdf_files: list[tuple[str, bytes]],
     chart_files: list[Path],
     df_main: pd.DataFrame,
     df_confidence: pd.DataFrame
@@ -16,8 +29,11 @@ def upload_results_to_cloud(
     """
     Upload PDFs, PNGs, and CSV results to cloud storage.
     
+    PDFs and PNGs are uploaded concurrently (network-bound), then the two CSVs.
+    Objects that already exist (e.g. from a retried run) are not rewritten.
+    
     Args:
-        pdf_files: List of PDF file paths
+        pdf_files: List of in-memory PDFs as (filename, pdf_bytes) tuples
         chart_files: List of chart image file paths
         df_main: Main extracted estimates DataFrame
         df_confidence: Confidence scores DataFrame
@@ -28,8 +44,12 @@ def upload_results_to_cloud(
     print("-" * 80)
     print(" ☁️  Step 5: Uploading results to cloud...")
     
-    failed_pdfs = [p.name for p in pdf_files if not upload_to_cloud(p, f"reports/{p.name}")]
-    failed_pngs = [p.name for p in chart_files if not upload_to_cloud(p, f"estimates/{p.name}")]
+    tasks = [(content, f"reports/{name}") for name, content in pdf_files] + \
+            [(p, f"estimates/{p.name}") for p in chart_files]
+    failed = _upload_files(tasks)
+    
+    failed_pdfs = [name for name, _ in pdf_files if f"reports/{name}" in failed]
+    failed_pngs = [p.name for p in chart_files if f"estimates/{p.name}" in failed]
     
     if failed_pdfs:
         raise Exception(f"Failed to upload PDFs: {', '.join(failed_pdfs)}")
@@ -38,10 +58,53 @@ def upload_results_to_cloud(
     
     print(f"✅ Uploaded {len(pdf_files)} PDF(s), {len(chart_files)} PNG(s)")
     
-    if not write_csv_to_cloud(df_main, "extracted_estimates.csv"):
-        raise Exception("Failed to upload extracted_estimates.csv")
-    if not write_csv_to_cloud(df_confidence, "extracted_estimates_confidence.csv"):
-        raise Exception("Failed to upload extracted_estimates_confidence.csv")
+    _update_latest_pdf_meta([name for name, _ in pdf_files])
+    
+    csv_uploads = [
+        (df_main, "extracted_estimates.csv"),
+        (df_confidence, "extracted_estimates_confidence.csv"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(csv_uploads)) as executor:
+        results = list(executor.map(lambda upload: write_csv_to_cloud(*upload), csv_uploads))
+    for (_, cloud_path), ok in zip(csv_uploads, results):
+        if not ok:
+            raise Exception(f"Failed to upload {cloud_path}")
     
     print(f"✅ Uploaded extracted_estimates.csv and extracted_estimates_confidence.csv")
 
+
+def _update_latest_pdf_meta(pdf_names: list[str]) -> None:
+    """Record the latest uploaded PDF date so Step 1 can skip listing the bucket."""
+    latest = latest_pdf_date(set(pdf_names))
+    if latest is None:
+        return
+    
+    meta = read_json_from_cloud(LATEST_PDF_META) or {}
+    try:
+        latest = max(latest, datetime.strptime(meta['latest_pdf_date'], '%Y-%m-%d'))
+    except (KeyError, ValueError):
+        pass
+    
+    if write_json_to_cloud({'latest_pdf_date': latest.strftime('%Y-%m-%d')}, LATEST_PDF_META):
+        print(f"✅ Updated {LATEST_PDF_META}: {latest.strftime('%Y-%m-%d')}")
+    else:
+        print(f"⚠️  Could not update {LATEST_PDF_META}")
+
+
+def _upload_files(tasks: list[tuple[Path | bytes, str]]) -> set[str]:
+    """Upload (local_path or content, cloud_path) pairs concurrently and return failed cloud paths."""
+    if not tasks:
+        return set()
+    
+    def upload(source: Path | bytes, key: str) -> bool:
+        if isinstance(source, bytes):
+            return upload_bytes_to_cloud(source, key, overwrite=False)
+        return upload_to_cloud(source, key, overwrite=False)
+    
+    failed = set()
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(tasks))) as executor:
+        futures = {executor.submit(upload, source, key): key for source, key in tasks}
+        for future in as_completed(futures):
+            if not future.result():
+                failed.add(futures[future])
+    return failed
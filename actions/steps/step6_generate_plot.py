@@ -1,5 +1,6 @@
 """Step 6: Generate and upload P/E ratio plot, and purge Camo cache."""
 
+import http.client
 import os
 import re
 import time
@@ -8,16 +9,26 @@ import json
 import tempfile
 from pathlib import Path
 
-from src.factset_report_analyzer.utils.plot import plot_pe_ratio_with_price
 from src.factset_report_analyzer.utils.cloudflare import upload_file_to_public_cloud
 
+# Camo URL structure: https://camo.githubusercontent.com/{hash}/{hex_encoded_url}
+_CAMO_HOST = 'camo.githubusercontent.com'
+_CAMO_RE = re.compile(rb'https://camo\.githubusercontent\.com/([^/]+)/([^"\s<>]+)')
+
 
 def generate_pe_ratio_plot() -> None:
-    """Generate P/E ratio plot, upload to public bucket, and purge Camo cache."""
+    """Generate P/E ratio plot, upload to public bucket, and purge Camo cache.
+    
+    Runs on every workflow run: scheduled runs always bring new price closes,
+    and the plot title carries the run date.
+    """
     print("-" * 80)
     print(" 📊 Step 6: Generating P/E ratio plot...")
     
     try:
+        # Imported here: matplotlib/yfinance are only needed for this step
+        from src.factset_report_analyzer.utils.plot import plot_pe_ratio_with_price
+        
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
             plot_path = tmp_path / "pe_ratio_plot.png"
@@ -45,28 +56,41 @@ def _purge_camo_cache() -> None:
             headers={"Accept": "application/vnd.github.html"}
         )
         with urllib.request.urlopen(req, timeout=30) as resp:
-            html = resp.read().decode('utf-8')
+            html = resp.read()
         
-        # Find and purge Camo URLs for pe_ratio_plot
-        # Camo URL structure: https://camo.githubusercontent.com/{hash}/{hex_encoded_url}
-        camo_matches = re.findall(r'https://camo\.githubusercontent\.com/([^/]+)/([^"\s<>]+)', html)
-        pe_urls = []
-        for hash_part, encoded_url in camo_matches:
+        # Find Camo URLs for pe_ratio_plot (scan bytes directly, no decode of the page)
+        pe_paths = set()
+        for match in _CAMO_RE.finditer(html):
             try:
+                hash_part, encoded_url = match.group(1).decode('ascii'), match.group(2).decode('ascii')
                 decoded = bytes.fromhex(encoded_url).decode('utf-8')
-                if 'pe_ratio_plot' in decoded:
-                    pe_urls.append(f'https://camo.githubusercontent.com/{hash_part}/{encoded_url}')
-            except:
-                pass
+            except ValueError:
+                continue
+            if 'pe_ratio_plot' in decoded:
+                pe_paths.add(f'/{hash_part}/{encoded_url}')
         
-        for url in set(pe_urls):  # Remove duplicates
-            try:
-                purge_req = urllib.request.Request(url, method='PURGE', headers={'User-Agent': 'GitHub-Actions'})
-                with urllib.request.urlopen(purge_req, timeout=10) as purge_resp:
-                    if json.loads(purge_resp.read().decode('utf-8')).get('status') == 'ok':
-                        print(f"✅ Purged Camo cache")
-            except:
-                pass
+        if pe_paths and _purge_camo_paths(pe_paths):
+            print(f"✅ Purged Camo cache")
     except Exception as e:
         print(f"⚠️  Could not purge Camo cache: {e}")
 
+
+def _purge_camo_paths(paths: set[str]) -> bool:
+    """Send PURGE requests for Camo URL paths over one keep-alive connection.
+    
+    Returns:
+        True if at least one purge succeeded
+    """
+    purged = False
+    conn = http.client.HTTPSConnection(_CAMO_HOST, timeout=10)
+    try:
+        for path in paths:
+            try:
+                conn.request('PURGE', path, headers={'User-Agent': 'GitHub-Actions'})
+                resp = conn.getresponse()
+                purged |= json.loads(resp.read().decode('utf-8')).get('status') == 'ok'
+            except Exception:
+                conn.close()  # Reconnects on the next request
+    finally:
+        conn.close()
+    return purged
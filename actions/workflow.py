@@ -3,7 +3,7 @@
 This script runs the full workflow:
 1. Check for new PDFs (reads last date from public URL CSV)
 2. Download new PDFs if available
-3. Extract EPS chart pages as PNGs
+3. Extract EPS chart pages as PNGs (overlapped with Step 2 downloads)
 4. Process images and extract data (auto-uploads CSV to public bucket)
 5. Upload PDF/PNG to private bucket
 6. Generate and upload P/E ratio plot
@@ -11,6 +11,7 @@ This script runs the full workflow:
 
 import sys
 import tempfile
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
 
@@ -22,6 +23,8 @@ from src.factset_report_analyzer.utils import CLOUD_STORAGE_ENABLED
 from actions.steps import (
     check_for_new_pdfs,
     download_new_pdfs,
+    create_extraction_pool,
+    submit_chart_extraction,
     extract_chart_pages,
     process_chart_images,
     upload_results_to_cloud,
@@ -46,16 +49,26 @@ def main():
         # Step 1: Check for new PDFs
         download_start_date, cloud_pdf_names = check_for_new_pdfs()
         
-        # Step 2: Download new PDFs
-        pdfs = download_new_pdfs(
-            start_date=download_start_date,
-            end_date=datetime.now(),
-            skip_existing=cloud_pdf_names
-        )
-        
-        # Steps 3-5: Process PDFs if new ones were downloaded
-        if pdfs:
-            _process_new_pdfs(pdfs)
+        # Steps 2-5 only when a report could have been published since the last one
+        if download_start_date.date() > datetime.now().date():
+            print("✅ Already up to date, no new PDFs to download")
+        else:
+            # Steps 2-3: Download new PDFs and extract chart pages as each one arrives
+            # (worker processes are only started once the first PDF is submitted)
+            with create_extraction_pool() as extract_pool:
+                extractions: list[Future] = []
+                pdfs = download_new_pdfs(
+                    start_date=download_start_date,
+                    end_date=datetime.now(),
+                    skip_existing=cloud_pdf_names,
+                    on_download=lambda pdf_info: extractions.append(
+                        submit_chart_extraction(extract_pool, pdf_info)
+                    )
+                )
+                
+                # Steps 3-5: Process PDFs if new ones were downloaded
+                if pdfs:
+                    _process_new_pdfs(pdfs, extractions)
         
         # Step 6: Generate and upload P/E ratio plot (always runs)
         generate_pe_ratio_plot()
@@ -72,27 +85,16 @@ def main():
     print("=" * 80)
 
 
-def _process_new_pdfs(pdfs: list[dict]) -> None:
+def _process_new_pdfs(pdfs: list[dict], extractions: list[Future]) -> None:
     """Process newly downloaded PDFs through steps 3-5."""
+    # PDFs stay in memory: extraction and upload both read the bytes directly
+    pdf_files = [(pdf_info['filename'], pdf_info['content']) for pdf_info in pdfs]
+    
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
         
-        # Save PDFs to temp files
-        pdf_files = []
-        for pdf_info in pdfs:
-            pdf_path = tmp_path / pdf_info['filename']
-            pdf_path.write_bytes(pdf_info['content'])
-            pdf_files.append(pdf_path)
-        
-        # Step 3: Extract chart pages
-        chart_data = extract_chart_pages(pdf_files)
-        
-        # Save PNGs to temp files
-        chart_files = []
-        for filename, image_bytes in chart_data:
-            chart_path = tmp_path / filename
-            chart_path.write_bytes(image_bytes)
-            chart_files.append(chart_path)
+        # Step 3: Save chart pages (extraction started during Step 2)
+        chart_files = extract_chart_pages(extractions, tmp_path)
         
         # Step 4: Process images
         df_main, df_confidence = process_chart_images(tmp_path)
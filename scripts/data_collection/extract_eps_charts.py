@@ -5,6 +5,7 @@ This script provides a command-line interface to extract chart pages from PDFs.
 For programmatic use, import from the main package:
     from factset_report_analyzer import extract_charts
 """
+import os
 import sys
 from pathlib import Path
 
@@ -23,25 +24,48 @@ def main() -> None:
     
     print("=" * 80)
     print("EPS Chart Extractor (CLI)")
-print("=" * 80)
+    print("=" * 80)
     print()
     
-    # Get PDF files
-    pdf_files = sorted(pdf_dir.glob("*.pdf"), reverse=True)
-                
+    # Get PDF files, newest first (sort names, not Path objects)
+    pdf_names = sorted(
+        (entry.name for entry in os.scandir(pdf_dir) if entry.name.endswith('.pdf')),
+        reverse=True
+    ) if pdf_dir.is_dir() else []
+    pdf_files = [pdf_dir / name for name in pdf_names]
+    
     if not pdf_files:
         print(f"⚠️  No PDF files found in {pdf_dir}")
         print(f"   Please run 'uv run python scripts/data_collection/download_factset_pdfs.py' first.")
         return
     
-    # Extract charts
-    charts = extract_charts(pdf_files, outpath=output_dir)
-                    
+    # Skip PDFs whose chart was already extracted
+    extracted = {
+        entry.name[:-4] for entry in os.scandir(output_dir) if entry.name.endswith('.png')
+    } if output_dir.is_dir() else set()
+    pdf_files = [p for p in pdf_files if _chart_stem(p) not in extracted]
+    if not pdf_files:
+        print(f"✅ All charts already extracted to {output_dir}")
+        return
+    
+    # Extract charts (one worker process per core; rendering is CPU-bound)
+    charts = extract_charts(pdf_files, max_workers=os.cpu_count() or 1)
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for filename, image_bytes in charts:
+        (output_dir / filename).write_bytes(image_bytes)
+    
     print()
     print("=" * 80)
     print(f"✅ Complete: {len(charts)} charts extracted to {output_dir}")
     print("=" * 80)
 
 
+def _chart_stem(pdf_file: Path) -> str:
+    """Get chart filename stem for a PDF (EarningsInsight_YYYYMMDD_*.pdf -> YYYYMMDD)."""
+    parts = pdf_file.stem.split('_')
+    return parts[1] if len(parts) > 1 else ''
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless they are selected with -m slow."""
+    if 'slow' in (config.getoption('-m') or ''):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test (run with -m slow)")
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
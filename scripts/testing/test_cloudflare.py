@@ -0,0 +1,68 @@
+"""Tests for reading the last CSV row from the public bucket."""
+
+import sys
+import urllib.error
+from pathlib import Path
+from unittest.mock import call, patch
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.factset_report_analyzer.utils.cloudflare import read_csv_tail_from_cloud
+
+FULL_CSV = b"Report_Date,Q1'14\n2024-01-05,27.85\n2024-01-12,27.90\n"
+
+
+def _patch_fetch(*responses):
+    """Patch _fetch_public_url to return (or raise) the given responses in order."""
+    return patch('src.factset_report_analyzer.utils.cloudflare._fetch_public_url', side_effect=responses)
+
+
+def test_partial_first_line_dropped_mid_file():
+    """Test that the first line is dropped when the range starts mid-file."""
+    # The tail's only line may be cut off, so it must not be used as the last row
+    newer_csv = FULL_CSV + b"2024-01-19,28.00\n"
+    with _patch_fetch((b"2024-01-12,27.90\n", 'bytes 35-51/52'), (newer_csv, '')):
+        assert read_csv_tail_from_cloud('extracted_estimates.csv') == ['2024-01-19', '28.00']
+    
+    with _patch_fetch((b"01-05,27.85\n2024-01-12,27.90\n", 'bytes 20-50/51')) as fetch:
+        assert read_csv_tail_from_cloud('extracted_estimates.csv') == ['2024-01-12', '27.90']
+    assert fetch.call_count == 1, "A complete row after the dropped line needs no full read"
+
+
+def test_first_line_kept_at_file_start():
+    """Test that a range starting at byte 0 keeps its (complete) first line."""
+    with _patch_fetch((b"2024-01-12,27.90\n", 'bytes 0-16/17')) as fetch:
+        assert read_csv_tail_from_cloud('extracted_estimates.csv') == ['2024-01-12', '27.90']
+    assert fetch.call_count == 1
+
+
+def test_no_complete_row_refetches_full_file():
+    """Test that a tail holding only a cut-off line falls back to a full read."""
+    with _patch_fetch((b"01-12,27.90\n\n", 'bytes 40-51/52'), (FULL_CSV, '')) as fetch:
+        assert read_csv_tail_from_cloud('extracted_estimates.csv', tail_bytes=12) == ['2024-01-12', '27.90']
+
+    url = fetch.call_args_list[0].args[0]
+    assert fetch.call_args_list == [call(url, 'bytes=-12'), call(url)]
+
+
+def test_range_not_satisfiable_falls_back_to_full_read():
+    """Test that a 416 response falls back to a full read."""
+    error = urllib.error.HTTPError('url', 416, 'Range Not Satisfiable', {}, None)
+    with _patch_fetch(error, (FULL_CSV, '')) as fetch:
+        assert read_csv_tail_from_cloud('extracted_estimates.csv') == ['2024-01-12', '27.90']
+
+    assert fetch.call_count == 2
+    assert len(fetch.call_args_list[1].args) == 1, "Fallback should not send a Range header"
+
+
+def test_header_only_csv_returns_none():
+    """Test that a CSV with only a header row has no last row."""
+    with _patch_fetch((b"Report_Date,Q1'14\n", 'bytes 0-17/18')):
+        assert read_csv_tail_from_cloud('extracted_estimates.csv') is None
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-v']))
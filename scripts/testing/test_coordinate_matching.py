@@ -3,26 +3,35 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import (
     match_quarters_with_numbers,
     find_quarters_at_bottom,
     extract_number,
     extract_quarter_pattern,
-    is_same_y_range,
-    calculate_distance,
 )
 
+# Chart image used by this script (extracted locally into output/estimates)
+TEST_IMAGE = PROJECT_ROOT / "output" / "estimates" / "20161209-6.png"
+
+
+def _candidate_number(text: str) -> float:
+    """Get number from OCR text, or NaN for Q patterns and non-numbers."""
+    if extract_quarter_pattern(text) is not None:
+        return np.nan
+    number = extract_number(text)
+    return np.nan if number is None else number
+
 
 def test_coordinate_matching():
     """Test coordinate-based matching."""
     
-    # Set image path (not a pytest fixture, just a local variable)
-    image_path = Path('output/estimates/20161209-6.png')
+    image_path = TEST_IMAGE
     
     if not image_path.exists():
         print(f"Test image not found: {image_path}")
@@ -30,6 +39,9 @@ def test_coordinate_matching():
     
     print(f"Processing image: {image_path}")
     
+    # Imported here: the Vision client is only needed when the image exists
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+    
     # Get OCR results
     ocr_results = extract_text_with_boxes(image_path)
     print(f"OCR results: {len(ocr_results)} text regions")
@@ -42,33 +54,29 @@ def test_coordinate_matching():
     
     # Check number candidates around each Q box
     print(f"\n=== Checking Number Candidates ===")
+    # Parse every box once (NaN = not a number, or a Q pattern), then scan with array ops
+    numbers = np.array([_candidate_number(box['text']) for box in ocr_results], dtype=float)
+    lefts = np.array([box['left'] for box in ocr_results], dtype=float)
+    tops = np.array([box['top'] for box in ocr_results], dtype=float)
+    center_x = lefts + np.array([box['width'] for box in ocr_results], dtype=float) / 2
+    center_y = tops + np.array([box['height'] for box in ocr_results], dtype=float) / 2
+    
+    y_tolerance = 50.0  # Wider tolerance
     for qb in quarter_boxes[:3]:
         print(f"\nQ box: {qb['quarter']} (y:{qb['top']}, x:{qb['left']})")
-        # Find all number candidates in the same y range
-        y_tolerance = 50.0  # Wider tolerance
-        candidates = []
-        for box in ocr_results:
-            if (box['left'] == qb['left'] and box['top'] == qb['top']):
-                continue
-            if extract_quarter_pattern(box['text']) is not None:
-                continue
-            number = extract_number(box['text'])
-            if number is None:
-                continue
-            if is_same_y_range(qb, box, y_tolerance):
-                distance = calculate_distance(qb, box)
-                candidates.append({
-                    'text': box['text'],
-                    'number': number,
-                    'x': box['left'],
-                    'y': box['top'],
-                    'distance': distance
-                })
+        # Find all number candidates in the same y range (center based)
+        q_center_x = qb['left'] + qb['width'] / 2
+        q_center_y = qb['top'] + qb['height'] / 2
+        is_self = (lefts == qb['left']) & (tops == qb['top'])
+        mask = ~np.isnan(numbers) & ~is_self & (np.abs(center_y - q_center_y) <= y_tolerance)
         
-        candidates.sort(key=lambda x: x['distance'])
+        candidates = np.flatnonzero(mask)
+        distances = np.hypot(center_x[candidates] - q_center_x, center_y[candidates] - q_center_y)
+        order = np.argsort(distances, kind='stable')
         print(f"  Number candidates: {len(candidates)} found")
-        for c in candidates[:5]:
-            print(f"    - '{c['text']}' = {c['number']} (x:{c['x']}, y:{c['y']}, distance:{c['distance']:.1f})")
+        for i, distance in zip(candidates[order[:5]], distances[order[:5]]):
+            box = ocr_results[i]
+            print(f"    - '{box['text']}' = {numbers[i]} (x:{box['left']}, y:{box['top']}, distance:{distance:.1f})")
     
     # Perform coordinate-based matching
     matched_results = match_quarters_with_numbers(
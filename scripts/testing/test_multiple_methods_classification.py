@@ -1,22 +1,26 @@
 """Test script for bar graph classification using all three methods."""
 
 import sys
-import cv2
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
 from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
-from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars
+
+# Chart image used by this script (extracted locally into output/estimates)
+TEST_IMAGE = PROJECT_ROOT / "output" / "estimates" / "20161209-6.png"
 
 
 def test_multiple_methods():
     """Classify bar graphs using all three methods and print results."""
-    # Set image path (not a pytest fixture, just a local variable)
-    image_path = Path('output/estimates/20161209-6.png')
+    image_path = TEST_IMAGE
+    
+    # Imported here so collecting this module does not load OpenCV and the Vision client
+    import cv2
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+    from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars
     
     # Read image
     image = cv2.imread(str(image_path))
@@ -24,7 +28,7 @@ def test_multiple_methods():
         print(f"Test image not found: {image_path}")
         return
     
-    # OCR and matching
+    # OCR and matching (set OCR_CACHE_DIR to reuse the OCR result across reruns)
     print("Performing OCR and matching...")
     ocr_results = extract_text_with_boxes(image_path)
     matched_results = match_quarters_with_numbers(ocr_results)
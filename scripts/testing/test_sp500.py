@@ -0,0 +1,71 @@
+"""Tests for 4-quarter EPS sums behind the P/E ratios."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.factset_report_analyzer.analysis.sp500 import calculate_eps_sum
+
+
+@pytest.fixture
+def df_eps():
+    """Three reports; there is no Q2'22 column."""
+    nan = np.nan
+    return pd.DataFrame({
+        'Report_Date': pd.to_datetime(['2021-01-08', '2021-02-05', '2021-04-09']),
+        "Q1'20": [10.0, nan, nan],
+        "Q2'20": [11.0, nan, nan],
+        "Q3'20": [12.0, nan, nan],
+        "Q4'20": [13.0, '13.5*', nan],      # Revised with a '*' mark
+        "Q1'21": [14.0, 14.5, 14.8],        # Revised by every report
+        "Q2'21": [15.0, nan, -100.0],       # Missing from the 2nd report
+        "Q3'21": [16.0, nan, nan],
+        "Q4'21": [17.0, nan, nan],
+        "Q1'22": [nan, nan, 18.0],
+    })
+
+
+DATES = pd.Series(pd.to_datetime([
+    '2021-01-04',  # Before the first report
+    '2021-01-15',  # After report 1 (Q1'21)
+    '2021-02-10',  # After report 2 (Q1'21)
+    '2021-04-12',  # After report 3 (Q2'21)
+    '2021-07-06',  # After report 3 (Q3'21)
+]), index=[10, 11, 12, 13, 14])
+
+
+@pytest.mark.parametrize('eps_type,expected', [
+    # Q(0)..Q(3): older report fills Q2'21-Q4'21 on 2021-02-10; negative Q2'21
+    # makes the 2021-04-12 sum non-positive; 2021-07-06 needs the missing Q2'22
+    ('forward', [np.nan, 62.0, 62.5, np.nan, np.nan]),
+    # Q(-4)..Q(-1): 2021-02-10 uses the starred revision of Q4'20; the
+    # 2021-07-06 window includes the negative Q2'21 revision
+    ('trailing', [np.nan, 46.0, 46.5, 51.3, np.nan]),
+])
+def test_calculate_eps_sum(df_eps, eps_type, expected):
+    """Test forward and trailing sums against hand-computed values."""
+    result = calculate_eps_sum(df_eps, DATES, eps_type)
+
+    assert result.index.equals(DATES.index)
+    np.testing.assert_allclose(result.to_numpy(dtype=float), expected, equal_nan=True)
+
+
+def test_calculate_eps_sum_unsorted_reports(df_eps):
+    """Test that report order in the input does not matter."""
+    shuffled = df_eps.iloc[[2, 0, 1]]
+
+    for eps_type in ('forward', 'trailing'):
+        pd.testing.assert_series_equal(
+            calculate_eps_sum(shuffled, DATES, eps_type),
+            calculate_eps_sum(df_eps, DATES, eps_type)
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-v']))
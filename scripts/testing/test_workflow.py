@@ -4,27 +4,30 @@ This module provides pytest-compatible tests for validating the workflow
 before deploying to GitHub Actions.
 """
 
+import functools
 import os
+import re
 import sys
 from pathlib import Path
 
-# CRITICAL: Add project root to path FIRST, before any imports
-# This ensures imports work in VS Code Test Explorer
+import pytest
+
+# Project imports resolve through pytest's pythonpath setting (pyproject.toml)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+WORKFLOW_PATH = PROJECT_ROOT / "actions" / "workflow.py"
 
-# Multiple ways to ensure path is set
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
-# Also try adding src directory
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+@pytest.fixture(scope='session')
+def workflow_source() -> str:
+    """Read the workflow script once per test session."""
+    return WORKFLOW_PATH.read_text()
 
-# Set environment variable
-os.environ['PYTHONPATH'] = str(PROJECT_ROOT)
 
-import pytest
+@functools.cache
+def _project_entries() -> dict[str, os.DirEntry]:
+    """List the project root once (DirEntry caches the file type from the listing)."""
+    with os.scandir(PROJECT_ROOT) as entries:
+        return {entry.name: entry for entry in entries}
 
 
 class TestImports:
@@ -32,7 +35,6 @@ class TestImports:
     
     def test_core_imports(self):
         """Test core function imports."""
-        # Use absolute import with explicit path handling
         try:
             from src.factset_report_analyzer import download_pdfs, extract_charts, process_images
             assert callable(download_pdfs)
@@ -118,63 +120,39 @@ class TestGoogleCredentials:
         if not creds_file.exists():
             pytest.skip(f"Credentials file not found: {creds_path}")
     
-    def test_google_vision_client(self):
+    @pytest.mark.slow
+    def test_google_vision_client(self, vision_client):
         """Test Google Cloud Vision client initialization."""
-        creds_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
-        
-        if not creds_path:
-            pytest.skip("GOOGLE_APPLICATION_CREDENTIALS not set")
-        
-        # Check if file exists in current project or absolute path
-        creds_file = Path(creds_path)
-        if not creds_file.is_absolute():
-            # Try relative to project root
-            creds_file = PROJECT_ROOT / creds_path
-        
-        if not creds_file.exists():
-            pytest.skip(f"Credentials file not found: {creds_path}")
-        
-        try:
-            from src.factset_report_analyzer.core.ocr.google_vision_processor import get_google_vision_client
-            client = get_google_vision_client()
-            assert client is not None, "Google Cloud Vision client should not be None"
-        except Exception as e:
-            pytest.fail(f"Failed to initialize Google Cloud Vision client: {e}")
+        assert vision_client is not None, "Google Cloud Vision client should not be None"
 
 
 class TestWorkflowStructure:
     """Test workflow structure without executing."""
     
-    def test_workflow_file_exists(self):
-        """Test workflow file exists."""
-        workflow_path = PROJECT_ROOT / "actions" / "workflow.py"
-        assert workflow_path.exists(), f"Workflow file not found: {workflow_path}"
+    def test_workflow_file_exists(self, workflow_source):
+        """Test workflow file exists (the fixture read it)."""
+        assert workflow_source, f"Workflow file is empty: {WORKFLOW_PATH}"
     
-    def test_workflow_main_function(self):
+    def test_workflow_main_function(self, workflow_source):
         """Test workflow has main function."""
-        workflow_path = PROJECT_ROOT / "actions" / "workflow.py"
-        
-        with open(workflow_path, 'r') as f:
-            content = f.read()
-            assert 'def main():' in content, "main() function not found in workflow"
+        assert 'def main():' in workflow_source, "main() function not found in workflow"
     
-    def test_workflow_steps(self):
+    def test_workflow_steps(self, workflow_source):
         """Test workflow contains all required steps."""
-        workflow_path = PROJECT_ROOT / "actions" / "workflow.py"
+        steps = [
+            "check for new pdfs",
+            "download new pdfs",
+            "extract chart",
+            "process",
+            "upload"
+        ]
         
-        with open(workflow_path, 'r') as f:
-            content = f.read().lower()
-            
-            steps = [
-                "check for new pdfs",
-                "download new pdfs",
-                "extract chart",
-                "process",
-                "upload"
-            ]
-            
-            missing_steps = [step for step in steps if step not in content]
-            assert not missing_steps, f"Missing workflow steps: {missing_steps}"
+        # One case-insensitive pass over the source for all steps
+        pattern = re.compile('|'.join(map(re.escape, steps)), re.IGNORECASE)
+        found = {match.lower() for match in pattern.findall(workflow_source)}
+        
+        missing_steps = [step for step in steps if step not in found]
+        assert not missing_steps, f"Missing workflow steps: {missing_steps}"
     
     def test_workflow_imports(self):
         """Test workflow can be imported."""
@@ -206,13 +184,15 @@ class TestDirectoryStructure:
     
     def test_src_directory(self):
         """Test src directory exists."""
-        src_dir = PROJECT_ROOT / "src" / "factset_report_analyzer"
-        assert src_dir.exists(), "src/factset_report_analyzer/ directory should exist"
+        src_dir = _project_entries().get("src")
+        assert src_dir is not None and src_dir.is_dir(), "src/ directory should exist"
+        assert (Path(src_dir.path) / "factset_report_analyzer").is_dir(), \
+            "src/factset_report_analyzer/ directory should exist"
     
     def test_actions_directory(self):
         """Test actions directory exists."""
-        actions_dir = PROJECT_ROOT / "actions"
-        assert actions_dir.exists(), "actions/ directory should exist"
+        actions_dir = _project_entries().get("actions")
+        assert actions_dir is not None and actions_dir.is_dir(), "actions/ directory should exist"
 
 
 class TestWorkflowIntegration:
@@ -250,6 +230,30 @@ class TestWorkflowIntegration:
 
 
 # Pytest fixtures
+@pytest.fixture(scope='session')
+def vision_client():
+    """Google Cloud Vision client, created once per session."""
+    creds_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+    
+    if not creds_path:
+        pytest.skip("GOOGLE_APPLICATION_CREDENTIALS not set")
+    
+    # Check if file exists in current project or absolute path
+    creds_file = Path(creds_path)
+    if not creds_file.is_absolute():
+        # Try relative to project root
+        creds_file = PROJECT_ROOT / creds_path
+    
+    if not creds_file.exists():
+        pytest.skip(f"Credentials file not found: {creds_path}")
+    
+    try:
+        from src.factset_report_analyzer.core.ocr.google_vision_processor import get_google_vision_client
+        return get_google_vision_client()
+    except Exception as e:
+        pytest.fail(f"Failed to initialize Google Cloud Vision client: {e}")
+
+
 @pytest.fixture
 def project_root():
     """Fixture for project root path."""
@@ -270,16 +274,10 @@ def test_output_dir(output_dir):
     yield test_dir
 
 
-# Main function for running tests directly
-def main():
-    """Run all tests."""
+if __name__ == '__main__':
+    # Run all tests when executed directly
     print("\n" + "🚀" * 40)
     print("Workflow Test Suite")
     print("🚀" * 40 + "\n")
     
-    # Run pytest programmatically
-    pytest.main([__file__, "-v", "--tb=short"])
-
-
-if __name__ == '__main__':
-    main()
+    sys.exit(pytest.main([__file__, "-v", "--tb=short"]))
@@ -1,15 +1,22 @@
 """Script to visualize bar graph classification results."""
 
-import cv2
-import numpy as np
 from pathlib import Path
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
-from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
-from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars, get_bar_region_coordinates
+
+
+def _box_corners(box: dict) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Get (top-left, bottom-right) corners of an OCR box."""
+    left, top = box['left'], box['top']
+    return (left, top), (left + box['width'], top + box['height'])
 
 
 def visualize_classification_results(image_path: Path, output_path: Path):
     """Visualize bar graph classification results."""
+    # Imported here so importing this script does not load OpenCV and the Vision client
+    import cv2
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+    from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
+    from src.factset_report_analyzer.core.ocr.bar_classifier import classify_all_bars
+    
     # Read image
     image = cv2.imread(str(image_path))
     if image is None:
@@ -41,18 +48,15 @@ def visualize_classification_results(image_path: Path, output_path: Path):
     print()
     
     for result in classified_results:
-        q_box = result['quarter_box']
-        num_box = result['number_box']
+        # Box corners computed once, shared by the rectangle and its label
+        (q_left, q_top), q_bottom_right = _box_corners(result['quarter_box'])
+        (num_left, num_top), num_bottom_right = _box_corners(result['number_box'])
         quarter = result['quarter']
         eps = result['eps']
         bar_color = result['bar_color']
         
         # Draw Q box (green)
-        q_left = q_box['left']
-        q_top = q_box['top']
-        q_right = q_left + q_box['width']
-        q_bottom = q_top + q_box['height']
-        cv2.rectangle(img_result, (q_left, q_top), (q_right, q_bottom), Q_BOX_COLOR, 2)
+        cv2.rectangle(img_result, (q_left, q_top), q_bottom_right, Q_BOX_COLOR, 2)
         
         # Display Q text
         cv2.putText(img_result, quarter, (q_left, q_top - 5),
@@ -62,11 +66,7 @@ def visualize_classification_results(image_path: Path, output_path: Path):
         num_box_color = DARK_BAR_COLOR if bar_color == 'dark' else LIGHT_BAR_COLOR
         
         # Draw number box (color changes based on bar graph type)
-        num_left = num_box['left']
-        num_top = num_box['top']
-        num_right = num_left + num_box['width']
-        num_bottom = num_top + num_box['height']
-        cv2.rectangle(img_result, (num_left, num_top), (num_right, num_bottom), num_box_color, 2)
+        cv2.rectangle(img_result, (num_left, num_top), num_bottom_right, num_box_color, 2)
         
         # Display number text (color changes based on bar graph type)
         eps_text = f"{eps}"
@@ -95,6 +95,11 @@ def visualize_classification_results(image_path: Path, output_path: Path):
 if __name__ == '__main__':
     import sys
     
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import enable_ocr_cache
+    
+    # Reuse OCR results across visualization runs on the same image
+    enable_ocr_cache()
+    
     if len(sys.argv) > 1:
         image_name = sys.argv[1]
     else:
@@ -1,14 +1,15 @@
 """Script to visualize coordinate-based matching results."""
 
-import cv2
-import numpy as np
 from pathlib import Path
-from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
-from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
 
 
 def visualize_matching_results(image_path: Path, output_path: Path):
     """Visualize coordinate-based matching results."""
+    # Imported here so importing this script does not load OpenCV and the Vision client
+    import cv2
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import extract_text_with_boxes
+    from src.factset_report_analyzer.core.ocr.coordinate_matcher import match_quarters_with_numbers
+    
     # Read image
     image = cv2.imread(str(image_path))
     if image is None:
@@ -24,15 +25,14 @@ def visualize_matching_results(image_path: Path, output_path: Path):
     # Create result image
     img_result = image.copy()
     
-    for result in matched_results:
-        q_box = result['quarter_box']
-        num_box = result['number_box']
-        
+    # Box geometry for all matches in one pass: corners and integer centers
+    q_boxes = _box_geometry([result['quarter_box'] for result in matched_results])
+    num_boxes = _box_geometry([result['number_box'] for result in matched_results])
+    
+    for result, (q_left, q_top, q_right, q_bottom, q_center_x, q_center_y), \
+            (num_left, num_top, num_right, num_bottom, num_center_x, num_center_y) in zip(
+                matched_results, q_boxes, num_boxes):
         # Draw Q box (green)
-        q_left = q_box['left']
-        q_top = q_box['top']
-        q_right = q_left + q_box['width']
-        q_bottom = q_top + q_box['height']
         cv2.rectangle(img_result, (q_left, q_top), (q_right, q_bottom), (0, 255, 0), 2)
         
         # Display Q text
@@ -40,10 +40,6 @@ def visualize_matching_results(image_path: Path, output_path: Path):
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         # Draw number box (red)
-        num_left = num_box['left']
-        num_top = num_box['top']
-        num_right = num_left + num_box['width']
-        num_bottom = num_top + num_box['height']
         cv2.rectangle(img_result, (num_left, num_top), (num_right, num_bottom), (0, 0, 255), 2)
         
         # Display number text
@@ -51,15 +47,7 @@ def visualize_matching_results(image_path: Path, output_path: Path):
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
         
         # Draw connection line (yellow)
-        q_center_x = q_left + q_box['width'] / 2
-        q_center_y = q_top + q_box['height'] / 2
-        num_center_x = num_left + num_box['width'] / 2
-        num_center_y = num_top + num_box['height'] / 2
-        
-        cv2.line(img_result, 
-                (int(q_center_x), int(q_center_y)),
-                (int(num_center_x), int(num_center_y)),
-                (0, 255, 255), 2)
+        cv2.line(img_result, (q_center_x, q_center_y), (num_center_x, num_center_y), (0, 255, 255), 2)
     
     # Save
     cv2.imwrite(str(output_path), img_result)
@@ -67,7 +55,22 @@ def visualize_matching_results(image_path: Path, output_path: Path):
     print(f"Total {len(matched_results)} matches completed")
 
 
+def _box_geometry(boxes: list[dict]) -> list[list[int]]:
+    """Get (left, top, right, bottom, center_x, center_y) for each OCR box."""
+    import numpy as np
+    
+    xywh = np.array([[box['left'], box['top'], box['width'], box['height']] for box in boxes],
+                    dtype=np.int32).reshape(-1, 4)
+    top_left, size = xywh[:, :2], xywh[:, 2:]
+    return np.hstack([top_left, top_left + size, top_left + size // 2]).tolist()
+
+
 if __name__ == '__main__':
+    from src.factset_report_analyzer.core.ocr.google_vision_processor import enable_ocr_cache
+    
+    # Reuse OCR results across visualization runs on the same image
+    enable_ocr_cache()
+    
     test_image = Path('output/estimates/20161209-6.png')
     output_path = Path('output/preprocessing_test/20161209-6_coordinate_matching.png')
     
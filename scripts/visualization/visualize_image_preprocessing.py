@@ -79,9 +79,8 @@ def apply_preprocessing_techniques(image_path: Path, output_dir: Path):
     cv2.imwrite(str(output_dir / '11_clahe_otsu.png'), clahe_otsu_binary)
     print("CLAHE + OTSU completed")
     
-    # 13. Denoising + OTSU
-    denoised_otsu = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
-    _, denoised_otsu_binary = cv2.threshold(denoised_otsu, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # 13. Denoising + OTSU (reuses the denoised image from step 9)
+    _, denoised_otsu_binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     cv2.imwrite(str(output_dir / '12_denoised_otsu.png'), denoised_otsu_binary)
     print("Denoising + OTSU completed")
     
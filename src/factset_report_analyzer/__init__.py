@@ -34,17 +34,44 @@ Example:
     >>> pe_trailing = sp500.pe_ratio
 """
 
-from .core import download_pdfs, extract_charts, process_images, process_image
-from .analysis import SP500
-from .utils.plot import plot_pe_ratio_with_price
+import importlib
+
+# Public API, imported on first access so that e.g. `from .utils import ...`
+# does not pull in OCR, PDF and plotting dependencies
+_LAZY_IMPORTS = {
+    'download_pdfs': '.core',
+    'iter_pdfs': '.core',
+    'extract_chart': '.core',
+    'extract_charts': '.core',
+    'process_images': '.core',
+    'process_image': '.core',
+    'SP500': '.analysis',
+    'plot_pe_ratio_with_price': '.utils.plot',
+}
 
 __version__ = "0.4.3"
 
 __all__ = [
     'download_pdfs',
+    'iter_pdfs',
+    'extract_chart',
     'extract_charts',
     'process_images',
     'process_image',
     'SP500',
     'plot_pe_ratio_with_price',
 ]
+
+
+def __getattr__(name: str):
+    """Import public API objects lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
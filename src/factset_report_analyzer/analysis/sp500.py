@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -10,10 +12,14 @@ from typing import Literal
 PE_RATIO_TYPE = Literal['forward', 'trailing']
 import tempfile
 
+import numpy as np
 import pandas as pd
 
 from ..utils.csv_storage import read_csv
 
+# Quarter column names in the EPS CSV (e.g. "Q1'14")
+_QUARTER_COL_RE = re.compile(r"Q([1-4])'(\d{2})")
+
 
 class SP500:
     """S&P 500 Market Data with EPS and P/E ratio calculations.
@@ -39,6 +45,7 @@ class SP500:
     def __init__(self):
         """Initialize and load S&P 500 and EPS data."""
         self._df_eps = None
+        self._eps_index = None
         self._price_df = None
         self._type: PE_RATIO_TYPE = 'forward'  # Default to forward
         self._load_data()
@@ -71,7 +78,8 @@ class SP500:
                 "EPS data not found. Please ensure extracted_estimates.csv is available."
             )
         
-        self._df_eps['Report_Date'] = pd.to_datetime(self._df_eps['Report_Date'])
+        # Dates are written as YYYY-MM-DD; a fixed format skips per-element format inference
+        self._df_eps['Report_Date'] = pd.to_datetime(self._df_eps['Report_Date'], format='%Y-%m-%d')
         self._df_eps = self._df_eps.sort_values('Report_Date')
         print(f"  ✅ EPS data: {len(self._df_eps)} reports")
         
@@ -97,6 +105,16 @@ class SP500:
         except Exception as e:
             raise Exception(f"Failed to load S&P 500 price data: {e}")
     
+    def _eps_sum(self, dates: pd.Series) -> pd.Series:
+        """Calculate 4-quarter EPS sums for the current type.
+        
+        The EPS data is prepared once and reused for both types and every
+        eps/pe_ratio access.
+        """
+        if self._eps_index is None:
+            self._eps_index = _build_eps_index(self._df_eps)
+        return _sum_eps_for_dates(self._eps_index, dates, self._type)
+    
     @property
     def price(self) -> pd.DataFrame:
         """Get all S&P 500 price data.
@@ -125,7 +143,7 @@ class SP500:
             >>> eps_data = sp500.eps  # trailing
         """
         dates = self._price_df['Date']
-        eps_values = calculate_eps_sum(self._df_eps, dates, self._type)
+        eps_values = self._eps_sum(dates)
         return pd.DataFrame({
             'Date': dates,
             'EPS': eps_values
@@ -146,7 +164,7 @@ class SP500:
         """
         dates = self._price_df['Date']
         price_data = self._price_df.copy()
-        price_data['EPS'] = calculate_eps_sum(self._df_eps, dates, self._type)
+        price_data['EPS'] = self._eps_sum(dates)
         price_data['PE_Ratio'] = price_data['Price'] / price_data['EPS']
         price_data['Type'] = self._type
         return price_data[['Date', 'Price', 'EPS', 'PE_Ratio', 'Type']].reset_index(drop=True)
@@ -164,18 +182,17 @@ class SP500:
             >>> print(f"Forward P/E: {current['pe_ratio']:.2f}")
         """
         pe_df = self.pe_ratio
-        # Find last row with valid EPS
-        valid_df = pe_df.dropna(subset=['EPS'])
-        if valid_df.empty:
+        # Find last row with valid EPS (scalar lookups, no filtered copy or row Series)
+        latest = pe_df['EPS'].last_valid_index()
+        if latest is None:
             return None
         
-        latest = valid_df.iloc[-1]
         return {
-            'date': latest['Date'],
-            'price': latest['Price'],
-            'eps': latest['EPS'],
-            'pe_ratio': latest['PE_Ratio'],
-            'type': latest['Type']
+            'date': pe_df.at[latest, 'Date'],
+            'price': pe_df.at[latest, 'Price'],
+            'eps': pe_df.at[latest, 'EPS'],
+            'pe_ratio': pe_df.at[latest, 'PE_Ratio'],
+            'type': pe_df.at[latest, 'Type']
         }
     
     @property
@@ -224,6 +241,10 @@ def calculate_eps_sum(
 ) -> pd.Series:
     """Calculate 4-quarter EPS sum for given dates.
     
+    For each date, every needed quarter takes its most recent estimate from the
+    reports published on or before that date. The sum is NaN if any of the four
+    quarters has no estimate yet or if the sum is not positive.
+    
     Args:
         df_eps: DataFrame with EPS data (must have 'Report_Date' column)
         dates: Series of dates to calculate EPS for
@@ -235,45 +256,86 @@ def calculate_eps_sum(
     Example:
         >>> eps_series = calculate_eps_sum(df_eps, df['Report_Date'], 'forward')
     """
-    df_eps_sorted = df_eps.sort_values('Report_Date')
+    return _sum_eps_for_dates(_build_eps_index(df_eps), dates, type)
+
+
+def _build_eps_index(df_eps: pd.DataFrame) -> dict:
+    """Prepare EPS data for 4-quarter sums (shared by forward and trailing).
+    
+    Returns:
+        Index dict with 'report_dates' (sorted), 'quarters' (sorted quarter
+        numbers) and 'values' (latest estimate of each quarter as of each report)
+    """
+    # SP500 keeps its EPS data sorted already; only sort input that is not
+    df_eps_sorted = df_eps if df_eps['Report_Date'].is_monotonic_increasing else df_eps.sort_values('Report_Date')
+    quarter_cols = sorted(
+        (col for col in df_eps_sorted.columns if _quarter_number(col) is not None),
+        key=_quarter_number
+    )
+    
+    # Latest known estimate of each quarter as of each report (later reports revise earlier ones)
+    values = _clean_eps_values(df_eps_sorted[quarter_cols]).ffill().to_numpy(dtype=float)
     
-    results = [
-        _calculate_eps_for_date(df_eps_sorted, date, type)
-        for date in dates
-    ]
-    return pd.Series(results, index=dates.index)
+    return {
+        'report_dates': df_eps_sorted['Report_Date'].to_numpy(dtype='datetime64[ns]'),
+        'quarters': np.array([_quarter_number(col) for col in quarter_cols], dtype=int),
+        'values': values,
+    }
 
 
-def _calculate_eps_for_date(
-    df_eps_sorted: pd.DataFrame,
-    price_date: pd.Timestamp,
-    type: PE_RATIO_TYPE
-) -> float | None:
-    """Calculate 4-quarter EPS sum for a single date."""
-    # Get quarter column names using price_date
-    if type == 'forward':
-        needed_quarters = quarter_mapper(price_date, 0, 3)
-    else:  # trailing
-        needed_quarters = quarter_mapper(price_date, -4, -1)
+def _sum_eps_for_dates(eps_index: dict, dates: pd.Series, type: PE_RATIO_TYPE) -> pd.Series:
+    """Calculate 4-quarter EPS sums for all dates at once from an EPS index."""
+    sums = np.full(len(dates), np.nan)
+    quarters = eps_index['quarters']
+    if not len(quarters) or not len(eps_index['report_dates']):
+        return pd.Series(sums, index=dates.index)
     
-    # Filter to only needed quarter columns
-    eps_candidates = df_eps_sorted[df_eps_sorted['Report_Date'] <= price_date]
-    if eps_candidates.empty:
-        return None
+    # Most recent report on or before each date (-1 if there is none yet)
+    date_index = pd.DatetimeIndex(dates)
+    report_idx = np.searchsorted(
+        eps_index['report_dates'], date_index.to_numpy(dtype='datetime64[ns]'), side='right'
+    ) - 1
+    
+    # Absolute quarter numbers needed for each date (same positions as quarter_mapper)
+    offsets = np.arange(0, 4) if type == 'forward' else np.arange(-4, 0)
+    needed = (date_index.year * 4 + date_index.quarter - 1).to_numpy()[:, None] + offsets
     
-    eps_filtered = eps_candidates[needed_quarters]
+    # Column holding each needed quarter (found=False if the CSV has no such column)
+    cols = np.searchsorted(quarters, needed).clip(max=len(quarters) - 1)
+    found = quarters[cols] == needed
     
-    # Get most recent value for each quarter column
-    values = [
-        float(str(eps_filtered[col].dropna().iloc[-1]).replace('*', '').strip())
-        for col in needed_quarters
-        if col in eps_filtered.columns and not eps_filtered[col].dropna().empty
-    ]
+    values = eps_index['values'][report_idx.clip(min=0)[:, None], cols]
+    valid = (report_idx >= 0) & found.all(axis=1) & ~np.isnan(values).any(axis=1)
+    sums[valid] = values[valid].sum(axis=1)
+    sums[sums <= 0] = np.nan
     
-    if len(values) == 4:
-        return sum(values) if sum(values) > 0 else None
+    return pd.Series(sums, index=dates.index)
+
+
+@lru_cache(maxsize=1024)
+def _quarter_number(column: str) -> int | None:
+    """Convert a quarter column name to year * 4 + quarter - 1 (e.g. "Q1'14" -> 8056).
     
-    return None
+    Cached: the same column names are parsed on every EPS/P/E calculation.
+    Returns None for columns that are not quarters.
+    """
+    match = _QUARTER_COL_RE.fullmatch(column)
+    if not match:
+        return None
+    return (2000 + int(match.group(2))) * 4 + int(match.group(1)) - 1
+
+
+def _clean_eps_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert EPS cells to floats ('*' marks are stripped, unparseable cells become NaN).
+
+    Columns read_csv already parsed as numbers are kept as is; only text
+    columns go through the string cleanup.
+    """
+    return df.apply(
+        lambda col: col if pd.api.types.is_numeric_dtype(col) else pd.to_numeric(
+            col.astype(str).str.replace('*', '', regex=False).str.strip(), errors='coerce'
+        )
+    )
 
 
 if __name__ == "__main__":
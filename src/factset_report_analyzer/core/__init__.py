@@ -1,13 +1,36 @@
 """Core functionality for FactSet data collection."""
 
-from .downloader import download_pdfs
-from .extractor import extract_charts
-from .ocr import process_images, process_image
+import importlib
+
+# Imported on first access: downloading does not need the PDF or OCR stacks
+_LAZY_IMPORTS = {
+    'download_pdfs': '.downloader',
+    'iter_pdfs': '.downloader',
+    'extract_chart': '.extractor',
+    'extract_charts': '.extractor',
+    'process_images': '.ocr',
+    'process_image': '.ocr',
+}
 
 __all__ = [
     'download_pdfs',
+    'iter_pdfs',
+    'extract_chart',
     'extract_charts',
     'process_images',
     'process_image',
 ]
 
+
+def __getattr__(name: str):
+    """Import public API objects lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
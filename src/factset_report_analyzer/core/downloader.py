@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import urllib.error
 import urllib.request
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -12,24 +15,48 @@ from pathlib import Path
 BASE_URL = "https://advantage.factset.com/hubfs/Website/Resources%20Section/Research%20Desk/Earnings%20Insight/"
 
 
+class _RateLimiter:
+    """Thread-safe limiter spacing request starts at least `interval` seconds apart."""
+    
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._next_allowed_at = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_allowed_at)
+            self._next_allowed_at = start_at + self._interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
 def download_pdfs(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     rate_limit: float = 0.05,
-    skip_existing: set[str] | None = None
+    skip_existing: set[str] | None = None,
+    max_workers: int = 8,
+    on_download: Callable[[dict], None] | None = None
 ) -> list[dict]:
     """Download FactSet Earnings Insight PDFs.
     
     Downloads PDFs from FactSet's public repository. Available from 2016 to present.
+    Dates are probed concurrently; `rate_limit` still caps the overall request rate.
     
     Args:
         start_date: Start date for download (default: 2016-01-01)
         end_date: End date for download (default: today)
-        rate_limit: Wait time between requests in seconds (default: 0.05)
+        rate_limit: Minimum interval between requests in seconds (default: 0.05)
         skip_existing: Set of existing filenames to skip
+        max_workers: Number of concurrent requests (default: 8)
+        on_download: Optional callback invoked with each PDF info dict as soon
+                     as it is downloaded, so callers can start processing
+                     before the whole search finishes
         
     Returns:
-        List of dictionaries containing download information:
+        List of dictionaries containing download information (newest first):
         - 'date': Report date (YYYY-MM-DD)
         - 'format': Date format used (MMDDYY or MMDDYYYY)
         - 'url': Download URL
@@ -41,6 +68,40 @@ def download_pdfs(
         PDFs are available from 2016 onwards. If start_date is before 2016,
         it will be automatically adjusted to 2016-01-01.
     """
+    found_pdfs = []
+    for pdf_info in iter_pdfs(start_date, end_date, rate_limit, skip_existing, max_workers):
+        if on_download:
+            on_download(pdf_info)
+        found_pdfs.append(pdf_info)
+    found_pdfs.sort(key=lambda pdf_info: pdf_info['date'], reverse=True)
+    
+    print(f"\n📊 Final Results: {len(found_pdfs)} PDFs downloaded")
+    return found_pdfs
+
+
+def iter_pdfs(
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    rate_limit: float = 0.05,
+    skip_existing: set[str] | None = None,
+    max_workers: int = 8
+) -> Iterator[dict]:
+    """Download FactSet Earnings Insight PDFs, yielding each one as it arrives.
+    
+    Streaming counterpart of download_pdfs: PDFs are yielded in completion
+    order, so a consumer can process and release each one without waiting
+    for the whole date range to be searched.
+    
+    Args:
+        start_date: Start date for download (default: 2016-01-01)
+        end_date: End date for download (default: today)
+        rate_limit: Minimum interval between requests in seconds (default: 0.05)
+        skip_existing: Set of existing filenames to skip
+        max_workers: Number of concurrent requests (default: 8)
+        
+    Yields:
+        PDF info dictionaries (same keys as returned by download_pdfs)
+    """
     # Set default dates
     if start_date is None:
         start_date = datetime(2016, 1, 1)
@@ -53,67 +114,92 @@ def download_pdfs(
         print(f"⚠️  Warning: PDFs are only available from 2016 onwards. Adjusting start_date to 2016-01-01.")
         start_date = min_date
     
-    found_pdfs: list[dict] = []
+    # Build candidate dates (reverse order), skipping formats already in cloud
+    candidates: list[tuple[datetime, list[str]]] = []
     current = end_date
-    test_count = 0
+    while current >= start_date:
+        formats = [
+            fmt for fmt in (
+                current.strftime("%m%d%y"),      # 121324
+                current.strftime("%m%d%Y"),      # 12132024
+            )
+            if not (skip_existing and _pdf_filename(current, fmt) in skip_existing)
+        ]
+        if formats:
+            candidates.append((current, formats))
+        current -= timedelta(days=1)  # Go back one day
     
     print("🔍 FactSet Earnings Insight PDF reverse search and download")
     print(f"Period: {end_date.date()} → {start_date.date()} (reverse)")
     print("=" * 80)
     
-    while current >= start_date:
-        # Date format conversion
-        formats = [
-            current.strftime("%m%d%y"),      # 121324
-            current.strftime("%m%d%Y"),      # 12132024
-        ]
-        
+    limiter = _RateLimiter(rate_limit)
+    progress = {'tested': 0, 'done': 0, 'found': 0}
+    progress_lock = threading.Lock()
+    
+    def fetch_date(candidate: tuple[datetime, list[str]]) -> dict | None:
+        date, formats = candidate
+        result = None
+        tested = 0
         for fmt in formats:
-            url = f"{BASE_URL}EarningsInsight_{fmt}.pdf"
-            test_count += 1
-            
-            try:
-                # Download with urllib
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    if response.status == 200:
-                        content = response.read()
-                        size_kb = len(content) / 1024
-                        
-                        # Filename
-                        filename = f"EarningsInsight_{current.strftime('%Y%m%d')}_{fmt}.pdf"
-                        
-                        # Skip if already exists in cloud
-                        if skip_existing and filename in skip_existing:
-                            continue
-                        
-                        found_pdfs.append({
-                            'date': current.strftime("%Y-%m-%d"),
-                            'format': fmt,
-                            'url': url,
-                            'size_kb': size_kb,
-                            'filename': filename,
-                            'content': content
-                        })
-                        
-                        print(f"✅ {current.strftime('%Y-%m-%d')}: {fmt:12s} | {size_kb:6.1f} KB | Download complete")
-                        break  # Move to next date if found
-            
-            except urllib.error.HTTPError:
-                pass  # 404, etc.
-            except Exception:
-                pass
+            tested += 1
+            pdf_info = _fetch_pdf(date, fmt, limiter)
+            if pdf_info:
+                result = pdf_info
+                print(f"✅ {pdf_info['date']}: {fmt:12s} | {pdf_info['size_kb']:6.1f} KB | Download complete")
+                break  # Move to next date if found
         
-        # Progress every 200 files
-        if test_count % 200 == 0:
-            elapsed_days = (end_date - current).days
-            total_days = (end_date - start_date).days
-            progress = elapsed_days / total_days * 100 if total_days > 0 else 0
-            print(f"⏳ Progress: {progress:.1f}% | Tested: {test_count:,} | Found: {len(found_pdfs)}")
-        
-        current -= timedelta(days=1)  # Go back one day
-        time.sleep(rate_limit)
+        with progress_lock:
+            before = progress['tested']
+            progress['tested'] += tested
+            progress['done'] += 1
+            progress['found'] += result is not None
+            # Progress every 200 requests
+            if progress['tested'] // 200 > before // 200:
+                pct = progress['done'] / len(candidates) * 100
+                print(f"⏳ Progress: {pct:.1f}% | Tested: {progress['tested']:,} | Found: {progress['found']}")
+        return result
     
-    print(f"\n📊 Final Results: {len(found_pdfs)} PDFs downloaded")
-    return found_pdfs
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = [executor.submit(fetch_date, candidate) for candidate in candidates]
+        for future in as_completed(futures):
+            pdf_info = future.result()
+            if pdf_info:
+                yield pdf_info
+    finally:
+        # A consumer that stops early (break, close(), exception) must not wait
+        # for every queued probe; drop the pending ones instead
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
+def _pdf_filename(date: datetime, fmt: str) -> str:
+    """Build local filename for a report date and URL date format."""
+    return f"EarningsInsight_{date.strftime('%Y%m%d')}_{fmt}.pdf"
+
+
+def _fetch_pdf(date: datetime, fmt: str, limiter: _RateLimiter) -> dict | None:
+    """Download a single PDF, returning its info dict or None if unavailable."""
+    url = f"{BASE_URL}EarningsInsight_{fmt}.pdf"
+    limiter.wait()
+    
+    try:
+        # Download with urllib
+        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(req, timeout=5) as response:
+            if response.status != 200:
+                return None
+            content = response.read()
+    except urllib.error.HTTPError:
+        return None  # 404, etc.
+    except Exception:
+        return None
+    
+    return {
+        'date': date.strftime("%Y-%m-%d"),
+        'format': fmt,
+        'url': url,
+        'size_kb': len(content) / 1024,
+        'filename': _pdf_filename(date, fmt),
+        'content': content
+    }
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,7 +18,8 @@ KEYWORDS = [
 
 
 def extract_charts(
-    pdfs: list[Path | str]
+    pdfs: list[Path | str | tuple[str, bytes]],
+    max_workers: int = 1
 ) -> list[tuple[str, bytes]]:
     """Extract EPS estimate chart pages from PDF files.
     
@@ -24,73 +27,98 @@ def extract_charts(
     and returns PNG image data in memory.
     
     Args:
-        pdfs: List of PDF file paths (Path objects or strings)
+        pdfs: List of PDF file paths (Path objects or strings) or in-memory
+              PDFs as (filename, pdf_bytes) tuples
+        max_workers: Number of worker processes (default: 1, runs in-process).
+                     Rendering is CPU-bound, so values up to os.cpu_count() scale.
         
     Returns:
         List of tuples (filename, image_bytes) for extracted PNG files
     """
-    extracted_files: list[tuple[str, bytes]] = []
+    pdfs = [p if isinstance(p, tuple) else Path(p) for p in pdfs]
     
     print(f"🔍 Extracting EPS charts from {len(pdfs)} PDFs")
     print("=" * 80)
     
-    for pdf_path in pdfs:
-        if isinstance(pdf_path, str):
-            pdf_path = Path(pdf_path)
-        
-        if not pdf_path.exists():
-            print(f"⚠️  Skipping {pdf_path.name}: File not found")
-            continue
-        
-        # Extract date from filename (EarningsInsight_20161209_120916.pdf -> 20161209)
-        try:
-            date_str = pdf_path.stem.split('_')[1]
-            report_date_dt = datetime.strptime(date_str, '%Y%m%d')
-            report_date = report_date_dt.strftime('%Y-%m-%d')
-        except (IndexError, ValueError):
-            print(f"⚠️  Skipping {pdf_path.name}: Cannot extract date from filename")
-            continue
-        
-        filename = f"{date_str}.png"
-        
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    
-                    if text and any(kw in text for kw in KEYWORDS):
-                        # Check keyword location (if at bottom of page)
-                        keyword_at_bottom = False
-                        for word in page.extract_words():
-                            if any(kw.split()[0] in word['text'] for kw in KEYWORDS):
-                                if word['top'] > 700:
-                                    keyword_at_bottom = True
-                                    break
-                        
-                        # If keyword is at bottom, extract next page
-                        if keyword_at_bottom and page_num + 1 < len(pdf.pages):
-                            target_page = pdf.pages[page_num + 1]
-                            target_page_num = page_num + 2
-                        else:
-                            target_page = page
-                            target_page_num = page_num + 1
-                        
-                        # Get image bytes (save to BytesIO instead of disk)
-                        import io
-                        img = target_page.to_image(resolution=300)
-                        img_bytes = io.BytesIO()
-                        img.save(img_bytes, format='PNG')
-                        image_bytes = img_bytes.getvalue()
-                        
-                        print(f"✅ {report_date:12s} Page {target_page_num:2d} -> {filename}")
-                        extracted_files.append((filename, image_bytes))
-                        break
-                else:
-                    print(f"⚠️  {report_date}: No EPS chart page found")
-        
-        except Exception as e:
-            print(f"❌ {report_date}: Error - {str(e)[:50]}")
+    workers = min(max_workers, len(pdfs))
+    if workers > 1:
+        # Small batches get one PDF per task so every worker is used;
+        # large backfills batch tasks to cut IPC round trips
+        chunksize = max(1, len(pdfs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(extract_chart, pdfs, chunksize=chunksize))
+    else:
+        results = [extract_chart(p) for p in pdfs]
+    
+    extracted_files = [r for r in results if r is not None]
     
     print(f"\n📊 Result: {len(extracted_files)} PNG files extracted")
     return extracted_files
 
+
+def extract_chart(pdf_file: Path | tuple[str, bytes]) -> tuple[str, bytes] | None:
+    """Extract the EPS chart page of a single PDF.
+    
+    Args:
+        pdf_file: PDF file path or in-memory PDF as (filename, pdf_bytes)
+        
+    Returns:
+        Tuple (filename, image_bytes), or None if no chart page was found
+    """
+    if isinstance(pdf_file, tuple):
+        pdf_name, content = pdf_file
+        source = io.BytesIO(content)
+    else:
+        if not pdf_file.exists():
+            print(f"⚠️  Skipping {pdf_file.name}: File not found")
+            return None
+        pdf_name, source = pdf_file.name, pdf_file
+    
+    # Extract date from filename (EarningsInsight_20161209_120916.pdf -> 20161209)
+    try:
+        date_str = Path(pdf_name).stem.split('_')[1]
+        report_date_dt = datetime.strptime(date_str, '%Y%m%d')
+        report_date = report_date_dt.strftime('%Y-%m-%d')
+    except (IndexError, ValueError):
+        print(f"⚠️  Skipping {pdf_name}: Cannot extract date from filename")
+        return None
+    
+    filename = f"{date_str}.png"
+    
+    try:
+        with pdfplumber.open(source) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                text = page.extract_text()
+                
+                if text and any(kw in text for kw in KEYWORDS):
+                    # Check keyword location (if at bottom of page)
+                    keyword_at_bottom = False
+                    for word in page.extract_words():
+                        if any(kw.split()[0] in word['text'] for kw in KEYWORDS):
+                            if word['top'] > 700:
+                                keyword_at_bottom = True
+                                break
+                    
+                    # If keyword is at bottom, extract next page
+                    if keyword_at_bottom and page_num + 1 < len(pdf.pages):
+                        target_page = pdf.pages[page_num + 1]
+                        target_page_num = page_num + 2
+                    else:
+                        target_page = page
+                        target_page_num = page_num + 1
+                    
+                    # Get image bytes (save to BytesIO instead of disk); optimize
+                    # picks the smallest zlib encoding, shrinking the uploaded PNG
+                    img = target_page.to_image(resolution=300)
+                    img_bytes = io.BytesIO()
+                    img.save(img_bytes, format='PNG', optimize=True)
+                    
+                    print(f"✅ {report_date:12s} Page {target_page_num:2d} -> {filename}")
+                    return filename, img_bytes.getvalue()
+            
+            print(f"⚠️  {report_date}: No EPS chart page found")
+    
+    except Exception as e:
+        print(f"❌ {report_date}: Error - {str(e)[:50]}")
+    
+    return None
@@ -1,8 +1,18 @@
 """OCR processing for chart images."""
 
-from .processor import process_directory as process_images, process_image
-from .google_vision_processor import extract_text_from_image, extract_text_with_boxes
-from .parser import parse_quarter, parse_number, get_report_date_from_filename
+import importlib
+
+# Imported on first access: submodules like coordinate_matcher can be used
+# without loading cv2, pandas and the Google Vision client
+_LAZY_IMPORTS = {
+    'process_images': ('.processor', 'process_directory'),
+    'process_image': ('.processor', 'process_image'),
+    'extract_text_from_image': ('.google_vision_processor', 'extract_text_from_image'),
+    'extract_text_with_boxes': ('.google_vision_processor', 'extract_text_with_boxes'),
+    'parse_quarter': ('.parser', 'parse_quarter'),
+    'parse_number': ('.parser', 'parse_number'),
+    'get_report_date_from_filename': ('.parser', 'get_report_date_from_filename'),
+}
 
 __all__ = [
     'process_images',
@@ -13,3 +23,18 @@ __all__ = [
     'parse_number',
     'get_report_date_from_filename',
 ]
+
+
+def __getattr__(name: str):
+    """Import public API objects lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
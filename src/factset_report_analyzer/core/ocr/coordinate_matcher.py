@@ -1,7 +1,19 @@
 """Module for matching quarter (Q) patterns and numbers (EPS) based on coordinates."""
 
+import bisect
 import re
 import math
+from functools import lru_cache
+
+# Compiled once at import (these run for every OCR box)
+_Q_MISREAD_RE = re.compile(r'^[O0](?=[1-4])', re.IGNORECASE)
+_ONE_MISREAD_RE = re.compile(r'Q([Il])(?=\d)', re.IGNORECASE)
+_QUARTER_APOSTROPHE_RE = re.compile(r"Q([1-4])'(\d{2})", re.IGNORECASE)
+_QUARTER_FULL_YEAR_RE = re.compile(r"Q([1-4])\s+20(\d{2})", re.IGNORECASE)
+_QUARTER_NO_APOSTROPHE_RE = re.compile(r"Q([1-4])(\d{2})", re.IGNORECASE)
+_QUARTER_ZERO_PREFIX_RE = re.compile(r"[0Oo]([1-4])(\d{2})")
+_QUARTER_GARBLED_RE = re.compile(r"Q([1-4])[iIl1](\d)[yi]", re.IGNORECASE)
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
 
 
 def normalize_quarter_text(text: str) -> str:
@@ -18,16 +30,17 @@ def normalize_quarter_text(text: str) -> str:
         Normalized text
     """
     # Convert O or 0 recognized as Q to Q
-    text = re.sub(r'^[O0](?=[1-4])', 'Q', text, flags=re.IGNORECASE)
+    text = _Q_MISREAD_RE.sub('Q', text)
     
     # Convert I or l recognized as 1 to 1 (only when following Q)
-    text = re.sub(r'Q([Il])(?=\d)', r'Q1', text, flags=re.IGNORECASE)
+    text = _ONE_MISREAD_RE.sub('Q1', text)
     
     return text
 
 
+@lru_cache(maxsize=8192)
 def extract_quarter_pattern(text: str) -> str | None:
-    """Extract Q(1-4)YY pattern from text.
+    """Extract Q(1-4)YY pattern from text (cached: OCR texts repeat).
     
     Args:
         text: Original text
@@ -39,24 +52,21 @@ def extract_quarter_pattern(text: str) -> str | None:
     normalized = normalize_quarter_text(text)
     
     # Pattern: Q1'17, Q2'18, etc.
-    pattern = r"Q([1-4])'(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_APOSTROPHE_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
         return f"Q{quarter}'{year}"
     
     # Pattern: Q1 2017, Q2 2018, etc.
-    pattern = r"Q([1-4])\s+20(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_FULL_YEAR_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
         return f"Q{quarter}'{year}"
     
     # Pattern: Q114, Q214, etc. (when OCR recognizes Q1'14 as Q114)
-    pattern = r"Q([1-4])(\d{2})"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_NO_APOSTROPHE_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
@@ -65,8 +75,7 @@ def extract_quarter_pattern(text: str) -> str | None:
             return f"Q{quarter}'{year}"
     
     # Pattern: 0114, 0214, etc. (when OCR recognizes Q1'14 as 0114)
-    pattern = r"[0Oo]([1-4])(\d{2})"
-    match = re.search(pattern, normalized)
+    match = _QUARTER_ZERO_PREFIX_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year = match.group(2)
@@ -75,8 +84,7 @@ def extract_quarter_pattern(text: str) -> str | None:
             return f"Q{quarter}'{year}"
     
     # Pattern: Q1i7y, Q2i7y, etc. (when OCR misrecognizes Q1'17)
-    pattern = r"Q([1-4])[iIl1](\d)[yi]"
-    match = re.search(pattern, normalized, re.IGNORECASE)
+    match = _QUARTER_GARBLED_RE.search(normalized)
     if match:
         quarter = match.group(1)
         year_digit = match.group(2)
@@ -90,8 +98,9 @@ def extract_quarter_pattern(text: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=8192)
 def extract_number(text: str) -> float | None:
-    """Extract number from text.
+    """Extract number from text (cached: OCR texts repeat).
     
     Args:
         text: Text containing numbers
@@ -103,8 +112,7 @@ def extract_number(text: str) -> float | None:
     cleaned = text.replace(',', '').replace('-', '')
     
     # Pattern for numbers with decimal points
-    pattern = r'-?\d+\.?\d*'
-    match = re.search(pattern, cleaned)
+    match = _NUMBER_RE.search(cleaned)
     
     if match:
         try:
@@ -189,9 +197,46 @@ def find_quarters_at_bottom(ocr_results: list[dict], bottom_percent: float = 0.3
     return quarter_boxes
 
 
+def build_number_index(ocr_results: list[dict]) -> dict:
+    """Build a lookup index of number boxes sorted by center x coordinate.
+    
+    Each box's text is parsed once here, so repeated nearest-number queries
+    only look at boxes inside their x window (binary search) instead of
+    re-scanning and re-parsing every OCR box.
+    
+    Args:
+        ocr_results: OCR result list
+        
+    Returns:
+        Index dict with 'center_x' (sorted) and matching 'entries'
+        (order, box, number, center_x, center_y)
+    """
+    entries = []
+    for order, box in enumerate(ocr_results):
+        # Exclude text containing Q pattern
+        if extract_quarter_pattern(box['text']) is not None:
+            continue
+        
+        # Check if number; exclude large numbers like years (>= 2000)
+        number = extract_number(box['text'])
+        if number is None or number >= 2000:
+            continue
+        
+        center_x = box['left'] + box['width'] / 2
+        center_y = box['top'] + box['height'] / 2
+        entries.append((order, box, number, center_x, center_y))
+    
+    entries.sort(key=lambda entry: entry[3])
+    return {
+        'center_x': [entry[3] for entry in entries],
+        'entries': entries,
+    }
+
+
 def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict], 
                                    y_tolerance: float = 1000.0,
-                                   x_tolerance: float = 10.0) -> dict | None:
+                                   x_tolerance: float = 10.0,
+                                   number_index: dict | None = None) -> dict | None:
     """Find nearest number within same y range.
     
     Args:
@@ -199,17 +244,26 @@ def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict],
         ocr_results: OCR result list
         y_tolerance: y coordinate tolerance (maximum distance to numbers above Q box)
         x_tolerance: x coordinate tolerance (only consider numbers at similar x position, very small)
+        number_index: Index from build_number_index(ocr_results), built if not given
         
     Returns:
         Nearest number box or None
     """
-    candidate_numbers = []
+    if number_index is None:
+        number_index = build_number_index(ocr_results)
     
     # Center coordinates of Q box
     q_center_x = quarter_box['left'] + quarter_box['width'] / 2
     q_center_y = quarter_box['top'] + quarter_box['height'] / 2
     
-    for box in ocr_results:
+    # Only boxes whose center x is within tolerance (window padded for float
+    # rounding; the exact check is below)
+    margin = x_tolerance + 1e-6
+    lo = bisect.bisect_left(number_index['center_x'], q_center_x - margin)
+    hi = bisect.bisect_right(number_index['center_x'], q_center_x + margin)
+    
+    best = None
+    for order, box, number, box_center_x, box_center_y in number_index['entries'][lo:hi]:
         # Exclude same box (compare by coordinates)
         if (box['left'] == quarter_box['left'] and 
             box['top'] == quarter_box['top'] and
@@ -217,19 +271,6 @@ def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict],
             box['height'] == quarter_box['height']):
             continue
         
-        # Exclude text containing Q pattern
-        if extract_quarter_pattern(box['text']) is not None:
-            continue
-        
-        # Check if number
-        number = extract_number(box['text'])
-        if number is None:
-            continue
-        
-        # Center coordinates of box
-        box_center_x = box['left'] + box['width'] / 2
-        box_center_y = box['top'] + box['height'] / 2
-        
         # Check if above Q box (y coordinate should be smaller)
         if box_center_y >= q_center_y:
             continue
@@ -244,28 +285,23 @@ def find_nearest_number_in_y_range(quarter_box: dict, ocr_results: list[dict],
         if x_diff > x_tolerance:
             continue
         
-        # Exclude large numbers like years (>= 2000)
-        if number >= 2000:
-            continue
-        
         # Calculate distance (weight x difference much more)
         distance = math.sqrt(x_diff ** 2 * 10 + y_diff ** 2 * 0.1)  # 10x weight on x difference
         
-        candidate_numbers.append({
-            **box,
-            'number': number,
-            'distance': distance,
-            'x_diff': x_diff,
-            'y_diff': y_diff
-        })
-    
-    if not candidate_numbers:
-        return None
-    
-    # Sort by distance (closest first)
-    candidate_numbers.sort(key=lambda x: x['distance'])
-    
-    return candidate_numbers[0]
+        # Closest first; ties go to the earlier OCR box
+        if best is None or (distance, order) < (best['distance'], best['order']):
+            best = {
+                **box,
+                'number': number,
+                'distance': distance,
+                'x_diff': x_diff,
+                'y_diff': y_diff,
+                'order': order
+            }
+    
+    if best is not None:
+        del best['order']
+    return best
 
 
 def match_quarters_with_numbers(ocr_results: list[dict], 
@@ -290,11 +326,12 @@ def match_quarters_with_numbers(ocr_results: list[dict],
         return []
     
     matched_results = []
+    number_index = build_number_index(ocr_results)
     
     for quarter_box in quarter_boxes:
         # Find nearest number within same y range
         nearest_number_box = find_nearest_number_in_y_range(
-            quarter_box, ocr_results, y_tolerance, x_tolerance
+            quarter_box, ocr_results, y_tolerance, x_tolerance, number_index
         )
         
         if nearest_number_box:
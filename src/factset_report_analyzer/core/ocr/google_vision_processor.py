@@ -1,7 +1,10 @@
 """Module for image OCR processing using Google Cloud Vision API."""
 
 from pathlib import Path
+import hashlib
+import json
 import os
+import tempfile
 import cv2
 import numpy as np
 from dotenv import load_dotenv
@@ -15,6 +18,13 @@ except ImportError:
 
 load_dotenv()
 
+# Maximum images per batch_annotate_images request (API limit: 16)
+BATCH_SIZE = 16
+
+# Cache directory used by enable_ocr_cache() (the OCR_CACHE_DIR environment
+# variable turns the extract_text_with_boxes disk cache on; disabled if unset)
+DEFAULT_OCR_CACHE_DIR = 'output/.ocr_cache'
+
 
 def get_google_vision_client():
     """Returns Google Cloud Vision client."""
@@ -59,24 +69,114 @@ def extract_text_from_image(image_path: Path) -> str:
 def extract_text_with_boxes(image_path: Path) -> list[dict]:
     """Extract text and location information from image (using Google Cloud Vision API).
     
+    Results are cached on disk when OCR_CACHE_DIR is set.
+    
     Args:
         image_path: Image file path
         
     Returns:
         List of dictionaries containing text and location information
     """
-    client = get_google_vision_client()
-    
     # Read image
     with open(image_path, 'rb') as image_file:
         content = image_file.read()
     
+    cache_file = _ocr_cache_file(content)
+    cached = _read_ocr_cache(cache_file)
+    if cached is not None:
+        return cached
+    
+    client = get_google_vision_client()
     image = vision.Image(content=content)
     response = client.text_detection(image=image)
     
     if response.error.message:
         raise Exception(f"Google Vision API error: {response.error.message}")
     
+    results = _parse_text_annotations(response)
+    _write_ocr_cache(cache_file, results)
+    
+    return results
+
+
+def enable_ocr_cache(cache_dir: str = DEFAULT_OCR_CACHE_DIR) -> None:
+    """Turn on the OCR disk cache for this process (for local reruns on the same charts).
+    
+    An OCR_CACHE_DIR already set in the environment takes precedence.
+    """
+    os.environ.setdefault('OCR_CACHE_DIR', cache_dir)
+
+
+def _ocr_cache_file(content: bytes) -> Path | None:
+    """Get the OCR cache file for image content (None if caching is disabled)."""
+    # Read per call, so enabling the cache works regardless of import order
+    cache_dir = os.getenv('OCR_CACHE_DIR')
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"{hashlib.sha256(content).hexdigest()}.json"
+
+
+def _read_ocr_cache(cache_file: Path | None) -> list[dict] | None:
+    """Read cached OCR results (None on a miss, including unreadable or corrupt files)."""
+    if cache_file is None:
+        return None
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_ocr_cache(cache_file: Path | None, results: list[dict]) -> None:
+    """Write OCR results to the cache atomically (temp file + rename), so an
+    interrupted write never leaves a truncated cache file behind."""
+    if cache_file is None:
+        return
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def extract_text_with_boxes_batch(image_paths: list[Path]) -> list[list[dict] | None]:
+    """Extract text boxes from multiple images with batched API requests.
+    
+    Sends up to BATCH_SIZE images per `batch_annotate_images` call instead of
+    one request per image.
+    
+    Args:
+        image_paths: Image file paths
+        
+    Returns:
+        OCR results per image, in input order (None for images the API rejected)
+    """
+    client = get_google_vision_client()
+    feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+    
+    results: list[list[dict] | None] = []
+    for start in range(0, len(image_paths), BATCH_SIZE):
+        requests = []
+        for image_path in image_paths[start:start + BATCH_SIZE]:
+            with open(image_path, 'rb') as image_file:
+                content = image_file.read()
+            requests.append(vision.AnnotateImageRequest(
+                image=vision.Image(content=content),
+                features=[feature]
+            ))
+        
+        batch_response = client.batch_annotate_images(requests=requests)
+        for response in batch_response.responses:
+            results.append(None if response.error.message else _parse_text_annotations(response))
+    
+    return results
+
+
+def _parse_text_annotations(response) -> list[dict]:
+    """Convert a text detection response into text box dictionaries."""
     results = []
     
     if response.text_annotations:
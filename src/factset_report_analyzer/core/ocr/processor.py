@@ -1,6 +1,7 @@
 """Main processor for extracting quarters and values from chart images."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -11,7 +12,12 @@ from ...utils.csv_storage import read_csv
 from ...utils.cloudflare import read_csv_from_cloud
 from .bar_classifier import classify_all_bars
 from .coordinate_matcher import match_quarters_with_numbers
-from .google_vision_processor import extract_text_from_image, extract_text_with_boxes
+from .google_vision_processor import (
+    BATCH_SIZE as OCR_BATCH_SIZE,
+    extract_text_from_image,
+    extract_text_with_boxes,
+    extract_text_with_boxes_batch
+)
 from .parser import (
     extract_quarter_eps_pairs,
     get_report_date_from_filename
@@ -25,18 +31,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def process_image(image_path: Path) -> list[dict]:
+def process_image(image_path: Path, ocr_results: list[dict] | None = None) -> list[dict]:
     """Extract quarter and EPS information from a single image.
     
     Args:
         image_path: Image file path
+        ocr_results: Pre-computed OCR results (e.g., from a batched request).
+                     If None, OCR is performed for this image.
         
     Returns:
         List of dictionaries containing quarter and EPS information
     """
     try:
         # Perform OCR
-        ocr_results = extract_text_with_boxes(image_path)
+        if ocr_results is None:
+            ocr_results = extract_text_with_boxes(image_path)
         logger.debug(f"OCR results count: {len(ocr_results)}")
         
         if not ocr_results:
@@ -93,13 +102,18 @@ def process_image(image_path: Path) -> list[dict]:
 
 def _load_existing_data() -> tuple[pd.DataFrame | None, pd.DataFrame | None, set[str]]:
     """Load existing data from public URL and get processed dates."""
-    existing_df = read_csv_from_cloud("extracted_estimates.csv")
-    existing_confidence_df = read_csv_from_cloud("extracted_estimates_confidence.csv")
+    # Both CSVs are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        existing_df, existing_confidence_df = executor.map(
+            read_csv_from_cloud,
+            ["extracted_estimates.csv", "extracted_estimates_confidence.csv"]
+        )
     processed_dates = set()
     
     if existing_df is not None and not existing_df.empty:
         existing_df = existing_df.drop(columns=['Confidence'], errors='ignore')
-        existing_df['Report_Date'] = pd.to_datetime(existing_df['Report_Date'])
+        # Dates are written as YYYY-MM-DD; a fixed format skips per-element format inference
+        existing_df['Report_Date'] = pd.to_datetime(existing_df['Report_Date'], format='%Y-%m-%d')
         processed_dates = set(existing_df['Report_Date'].dt.strftime('%Y%m%d'))
     
     return existing_df, existing_confidence_df, processed_dates
@@ -177,9 +191,8 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
     
     # Initialize current_df with existing data (deep copy to avoid modification)
     if existing_df is not None and not existing_df.empty:
+        # Report_Date was already parsed to datetime by _load_existing_data
         current_df = existing_df.copy(deep=True)
-        # Ensure Report_Date is datetime (should already be, but ensure consistency)
-        current_df['Report_Date'] = pd.to_datetime(current_df['Report_Date'])
         print(f"📋 Loaded {len(current_df)} existing records")
         logger.debug(f"Existing dates: {sorted(current_df['Report_Date'].dt.strftime('%Y-%m-%d').tolist()[:5])}...")
     else:
@@ -187,12 +200,17 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
         print("📋 No existing data found")
     
     all_long_results = []
+    batch_ocr_results: dict[Path, list[dict] | None] = {}
     
     for idx, image_path in enumerate(image_files, 1):
+        # OCR the next batch of images in a single request
+        if (idx - 1) % OCR_BATCH_SIZE == 0:
+            batch_ocr_results = _extract_ocr_batch(image_files[idx - 1:idx - 1 + OCR_BATCH_SIZE])
+        
         print(f"[{idx}/{len(image_files)}] {image_path.name}", end=" ... ")
         
         try:
-            results = process_image(image_path)
+            results = process_image(image_path, batch_ocr_results.get(image_path))
             if not results:
                 print("⚠️  No data")
                 continue
@@ -220,7 +238,7 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
     if current_df.empty and (existing_df is not None and not existing_df.empty):
         # Format existing data before returning
         existing_df_formatted = existing_df.copy()
-        existing_df_formatted['Report_Date'] = pd.to_datetime(existing_df_formatted['Report_Date']).dt.strftime('%Y-%m-%d')
+        existing_df_formatted['Report_Date'] = existing_df_formatted['Report_Date'].dt.strftime('%Y-%m-%d')
         existing_confidence_formatted = existing_confidence_df.copy() if existing_confidence_df is not None and not existing_confidence_df.empty else pd.DataFrame(columns=['Report_Date'])
         if not existing_confidence_formatted.empty:
             existing_confidence_formatted['Report_Date'] = pd.to_datetime(existing_confidence_formatted['Report_Date']).dt.strftime('%Y-%m-%d')
@@ -245,6 +263,15 @@ def process_directory(directory: Path, limit: int | None = None) -> tuple[pd.Dat
     return current_df, confidence_df
 
 
+def _extract_ocr_batch(image_files: list[Path]) -> dict[Path, list[dict] | None]:
+    """Run batched OCR for images (empty dict on failure, so images fall back to per-image OCR)."""
+    try:
+        return dict(zip(image_files, extract_text_with_boxes_batch(image_files)))
+    except Exception as e:
+        logger.warning(f"Batch OCR failed, falling back to per-image OCR: {e}")
+        return {}
+
+
 def _calculate_new_confidence(all_long_results: list, current_df: pd.DataFrame) -> pd.DataFrame | None:
     """Calculate confidence DataFrame for newly processed data."""
     if not all_long_results:
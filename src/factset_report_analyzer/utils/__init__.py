@@ -3,9 +3,13 @@
 from .cloudflare import (
     CLOUD_STORAGE_ENABLED,
     upload_to_cloud,
+    upload_bytes_to_cloud,
     download_from_cloud,
     read_csv_from_cloud,
+    read_csv_tail_from_cloud,
     write_csv_to_cloud,
+    read_json_from_cloud,
+    write_json_to_cloud,
     file_exists_in_cloud,
     list_cloud_files,
 )
@@ -19,9 +23,13 @@ from .csv_storage import (
 __all__ = [
     'CLOUD_STORAGE_ENABLED',
     'upload_to_cloud',
+    'upload_bytes_to_cloud',
     'download_from_cloud',
     'read_csv_from_cloud',
+    'read_csv_tail_from_cloud',
     'write_csv_to_cloud',
+    'read_json_from_cloud',
+    'write_json_to_cloud',
     'file_exists_in_cloud',
     'list_cloud_files',
     'read_csv',
@@ -1,7 +1,14 @@
 """Cloudflare R2 storage utilities."""
 
+import csv
+import hashlib
 import io
+import json
 import os
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -9,9 +16,11 @@ import pandas as pd
 
 try:
     import boto3  # type: ignore[import-untyped]
+    from boto3.s3.transfer import TransferConfig  # type: ignore[import-untyped]
     from botocore.config import Config  # type: ignore[import-untyped]
 except ImportError:
     boto3 = None  # type: ignore[assignment]
+    TransferConfig = None  # type: ignore[assignment]
     Config = None  # type: ignore[assignment]
 
 load_dotenv()
@@ -35,9 +44,39 @@ _disabled = os.getenv('CLOUD_STORAGE_ENABLED', '').lower() == 'false'
 CLOUD_STORAGE_ENABLED = (_is_ci or _enabled) and _has_creds and not _disabled
 PUBLIC_BUCKET_ENABLED = CLOUD_STORAGE_ENABLED and bool(R2_PUBLIC_BUCKET_NAME)
 
+# Concurrent LIST requests for sharded listings
+MAX_LIST_WORKERS = 8
+
+# Shared S3 client (boto3 clients are thread-safe and pool connections,
+# sized to cover the concurrent uploads and listings)
+MAX_POOL_CONNECTIONS = 32
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+# Uploads at or above this size are split into parts sent in parallel
+# (R2/S3 require parts of at least 5 MiB, except the last one)
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=8
+) if TransferConfig else None
+
 
 def _get_s3_client():
-    """Get S3 client for R2."""
+    """Get S3 client for R2 (created once and reused across calls and threads)."""
+    global _s3_client
+    if _s3_client is not None:
+        return _s3_client
+    
+    with _s3_client_lock:
+        if _s3_client is None:
+            _s3_client = _create_s3_client()
+    return _s3_client
+
+
+def _create_s3_client():
+    """Create S3 client for R2."""
     if not CLOUD_STORAGE_ENABLED:
         print(f"CLOUD_STORAGE_ENABLED is False")
         return None
@@ -51,19 +90,20 @@ def _get_s3_client():
             endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
             aws_access_key_id=R2_ACCESS_KEY_ID,
             aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
+            config=Config(signature_version='s3v4', max_pool_connections=MAX_POOL_CONNECTIONS)
         )
     except Exception as e:
         print(f"Error creating S3 client: {e}")
         return None
 
 
-def upload_to_cloud(file_path: Path, cloud_path: str | None = None) -> bool:
+def upload_to_cloud(file_path: Path, cloud_path: str | None = None, overwrite: bool = True) -> bool:
     """Upload file to Cloudflare R2.
     
     Args:
         file_path: Local file path
         cloud_path: Cloud storage path (if None, uses file_path.name)
+        overwrite: If False, keep an existing object instead of re-uploading it
         
     Returns:
         True if successful, False otherwise (never raises exceptions)
@@ -78,13 +118,63 @@ def upload_to_cloud(file_path: Path, cloud_path: str | None = None) -> bool:
     cloud_path = cloud_path or file_path.name
     
     try:
-        s3_client.upload_file(str(file_path), R2_BUCKET_NAME, cloud_path)
-        return True
+        if overwrite:
+            s3_client.upload_file(str(file_path), R2_BUCKET_NAME, cloud_path, Config=_TRANSFER_CONFIG)
+            return True
+        return _put_if_absent(s3_client, cloud_path, file_path.read_bytes())
     except Exception:
         # Silently fail - don't interrupt local file saving
         return False
 
 
+def upload_bytes_to_cloud(data: bytes, cloud_path: str, overwrite: bool = True) -> bool:
+    """Upload in-memory data to Cloudflare R2.
+    
+    Args:
+        data: File content
+        cloud_path: Cloud storage path
+        overwrite: If False, keep an existing object instead of re-uploading it
+        
+    Returns:
+        True if successful, False otherwise (never raises exceptions)
+    """
+    s3_client = _get_s3_client()
+    if not s3_client:
+        return False
+    
+    try:
+        if not overwrite:
+            return _put_if_absent(s3_client, cloud_path, data)
+        if len(data) >= MULTIPART_THRESHOLD:
+            s3_client.upload_fileobj(io.BytesIO(data), R2_BUCKET_NAME, cloud_path, Config=_TRANSFER_CONFIG)
+        else:
+            s3_client.put_object(Bucket=R2_BUCKET_NAME, Key=cloud_path, Body=data)
+        return True
+    except Exception:
+        return False
+
+
+def _put_if_absent(s3_client, cloud_path: str, data: bytes) -> bool:
+    """Put object only if the key does not exist yet (single conditional request).
+    
+    An existing object makes R2 reject the write with 412 Precondition Failed,
+    which counts as success since the object is already there. Large payloads
+    are checked with HEAD first and then uploaded in parallel parts.
+    """
+    if len(data) >= MULTIPART_THRESHOLD:
+        if not file_exists_in_cloud(cloud_path):
+            s3_client.upload_fileobj(io.BytesIO(data), R2_BUCKET_NAME, cloud_path, Config=_TRANSFER_CONFIG)
+        return True
+    
+    try:
+        s3_client.put_object(Bucket=R2_BUCKET_NAME, Key=cloud_path, Body=data, IfNoneMatch='*')
+    except Exception as e:
+        response = getattr(e, 'response', None) or {}
+        if response.get('ResponseMetadata', {}).get('HTTPStatusCode') != 412:
+            raise
+    return True
+
+
 def download_from_cloud(cloud_path: str, local_path: Path) -> bool:
     """Download file from Cloudflare R2.
     
@@ -109,8 +199,6 @@ def download_from_cloud(cloud_path: str, local_path: Path) -> bool:
 
 def read_csv_from_cloud(cloud_path: str) -> pd.DataFrame | None:
     """Read CSV from public URL (no auth needed)."""
-    import urllib.request
-    
     try:
         url = f"{R2_PUBLIC_URL}/{cloud_path}"
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
@@ -120,26 +208,85 @@ def read_csv_from_cloud(cloud_path: str) -> pd.DataFrame | None:
         return None
 
 
+def read_csv_tail_from_cloud(cloud_path: str, tail_bytes: int = 8192) -> list[str] | None:
+    """Read the last row of a CSV from public URL (no auth needed).
+    
+    Only the last `tail_bytes` bytes are requested via an HTTP Range header,
+    so the cost does not grow with the file. Falls back to a full read if the
+    server rejects the range or the tail does not hold a complete row.
+    
+    Args:
+        cloud_path: Cloud file name
+        tail_bytes: Number of trailing bytes to fetch
+        
+    Returns:
+        Fields of the last row, or None if unavailable or the CSV has no rows
+    """
+    url = f"{R2_PUBLIC_URL}/{cloud_path}"
+    try:
+        try:
+            data, content_range = _fetch_public_url(url, f'bytes=-{tail_bytes}')
+        except urllib.error.HTTPError as e:
+            if e.code != 416:
+                return None
+            data, content_range = _fetch_public_url(url)  # Range not satisfiable
+        
+        lines = data.decode('utf-8').splitlines()
+        
+        # Drop the first line if the range starts mid-file (it may be cut off)
+        if content_range.startswith('bytes ') and not content_range[6:].startswith('0-'):
+            lines = lines[1:]
+            if not any(line.strip() for line in lines):
+                data, _ = _fetch_public_url(url)
+                lines = data.decode('utf-8').splitlines()
+    except Exception:
+        return None
+    
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return None
+    
+    row = next(csv.reader([lines[-1]]))
+    # Header only (no data rows)
+    if row and row[0] == 'Report_Date':
+        return None
+    return row
+
+
+def _fetch_public_url(url: str, byte_range: str | None = None) -> tuple[bytes, str]:
+    """Fetch public URL content, returning (body, Content-Range header)."""
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    if byte_range:
+        headers['Range'] = byte_range
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=10) as response:
+        return response.read(), response.headers.get('Content-Range', '')
+
+
 def write_csv_to_cloud(df: pd.DataFrame, cloud_path: str) -> bool:
-    """Write CSV to public bucket (requires auth)."""
-    if not PUBLIC_BUCKET_ENABLED or not boto3 or not Config:
+    """Write CSV to public bucket (requires auth).
+    
+    The upload is skipped if the stored object already has identical content.
+    """
+    if not PUBLIC_BUCKET_ENABLED:
+        return False
+    
+    s3_client = _get_s3_client()
+    if not s3_client:
         return False
     
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
-        
         csv_buffer = io.StringIO()
         df.to_csv(csv_buffer, index=False)
+        body = csv_buffer.getvalue().encode('utf-8')
+        
+        if _public_object_etag(s3_client, cloud_path) == hashlib.md5(body).hexdigest():
+            return True
+        
         s3_client.put_object(
             Bucket=R2_PUBLIC_BUCKET_NAME,
             Key=cloud_path,
-            Body=csv_buffer.getvalue().encode('utf-8'),
+            Body=body,
             ContentType='text/csv'
         )
         return True
@@ -147,6 +294,61 @@ def write_csv_to_cloud(df: pd.DataFrame, cloud_path: str) -> bool:
         return False
 
 
+def _public_object_etag(s3_client, cloud_path: str) -> str | None:
+    """Get ETag of a public bucket object (MD5 of the content for single-part uploads)."""
+    try:
+        response = s3_client.head_object(Bucket=R2_PUBLIC_BUCKET_NAME, Key=cloud_path)
+        return response['ETag'].strip('"')
+    except Exception:
+        return None
+
+
+def read_json_from_cloud(cloud_path: str) -> dict | None:
+    """Read JSON object from Cloudflare R2.
+    
+    Args:
+        cloud_path: Cloud storage path
+        
+    Returns:
+        Parsed JSON, or None if missing or unreadable (never raises exceptions)
+    """
+    s3_client = _get_s3_client()
+    if not s3_client:
+        return None
+    
+    try:
+        response = s3_client.get_object(Bucket=R2_BUCKET_NAME, Key=cloud_path)
+        return json.loads(response['Body'].read())
+    except Exception:
+        return None
+
+
+def write_json_to_cloud(data: dict, cloud_path: str) -> bool:
+    """Write JSON object to Cloudflare R2.
+    
+    Args:
+        data: JSON-serializable dictionary
+        cloud_path: Cloud storage path
+        
+    Returns:
+        True if successful, False otherwise (never raises exceptions)
+    """
+    s3_client = _get_s3_client()
+    if not s3_client:
+        return False
+    
+    try:
+        s3_client.put_object(
+            Bucket=R2_BUCKET_NAME,
+            Key=cloud_path,
+            Body=json.dumps(data).encode('utf-8'),
+            ContentType='application/json'
+        )
+        return True
+    except Exception:
+        return False
+
+
 def file_exists_in_cloud(cloud_path: str) -> bool:
     """Check if file exists in Cloudflare R2.
     
@@ -177,21 +379,17 @@ def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not PUBLIC_BUCKET_ENABLED or not boto3 or not Config:
+    if not PUBLIC_BUCKET_ENABLED:
         return False
     
     if not file_path.exists():
         return False
     
+    s3_client = _get_s3_client()
+    if not s3_client:
+        return False
+    
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
-        
         # Determine content type based on file extension
         content_type = 'application/octet-stream'
         if file_path.suffix.lower() == '.png':
@@ -205,7 +403,8 @@ def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
             str(file_path),
             R2_PUBLIC_BUCKET_NAME,
             cloud_path,
-            ExtraArgs={'ContentType': content_type}
+            ExtraArgs={'ContentType': content_type},
+            Config=_TRANSFER_CONFIG
         )
         return True
     except Exception as e:
@@ -213,11 +412,14 @@ def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
         return False
 
 
-def list_cloud_files(prefix: str = '') -> list[str]:
+def list_cloud_files(prefix: str = '', shards: list[str] | None = None) -> list[str]:
     """List files in Cloudflare R2 bucket with given prefix.
     
     Args:
         prefix: Prefix to filter files (e.g., 'estimates/' for PNG files, 'reports/' for PDFs)
+        shards: Optional sub-prefixes appended to `prefix` and listed concurrently
+                (e.g., one per year). Keys outside all shards are not returned.
+                Falls back to a single listing if any shard fails.
         
     Returns:
         List of file paths (keys) in cloud storage
@@ -226,15 +428,27 @@ def list_cloud_files(prefix: str = '') -> list[str]:
     if not s3_client:
         return []
     
+    if shards:
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_LIST_WORKERS, len(shards))) as executor:
+                pages = executor.map(lambda shard: _list_prefix(s3_client, prefix + shard), shards)
+                return [key for keys in pages for key in keys]
+        except Exception as e:
+            print(f"⚠️  Sharded listing failed (prefix={prefix}), listing without shards: {e}")
+    
     try:
-        files = []
-        paginator = s3_client.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix):
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    files.append(obj['Key'])
-        return files
+        return _list_prefix(s3_client, prefix)
     except Exception as e:
         print(f"Error listing cloud files (bucket={R2_BUCKET_NAME}, prefix={prefix}): {e}")
         return []
 
+
+def _list_prefix(s3_client, prefix: str) -> list[str]:
+    """List all keys under prefix, following pagination."""
+    files = []
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix):
+        if 'Contents' in page:
+            for obj in page['Contents']:
+                files.append(obj['Key'])
+    return files
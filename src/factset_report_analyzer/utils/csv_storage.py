@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from .cloudflare import read_csv_from_cloud, write_csv_to_cloud
+from .cloudflare import read_csv_from_cloud, read_csv_tail_from_cloud, write_csv_to_cloud
 
 
 def read_csv(cloud_path: str | None, local_path: Path) -> pd.DataFrame | None:
@@ -32,14 +32,16 @@ def write_csv(df: pd.DataFrame, cloud_path: str | None, local_path: Path) -> boo
 
 
 def get_last_date_from_csv(cloud_path: str | None, local_path: Path) -> datetime | None:
-    """Get last report date from CSV."""
-    df = read_csv(cloud_path, local_path)
-    if df is None or df.empty or 'Report_Date' not in df.columns:
+    """Get last report date from CSV.
+    
+    Rows are stored sorted by Report_Date, so only the last row is fetched.
+    """
+    last_row = read_csv_tail_from_cloud(cloud_path or local_path.name)
+    if not last_row:
         return None
     
     try:
-        df['Report_Date'] = pd.to_datetime(df['Report_Date'])
-        last_date = df['Report_Date'].max()
+        last_date = pd.to_datetime(last_row[0], format='%Y-%m-%d')
         return last_date.to_pydatetime() if pd.notna(last_date) else None
     except Exception:
         return None
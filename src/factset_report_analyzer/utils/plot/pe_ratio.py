@@ -61,7 +61,7 @@ def plot_pe_ratio_with_price(
     
     for idx, pe_type in enumerate(['trailing', 'forward']):
         sp500.set_type(pe_type)
-        df = sp500.pe_ratio.sort_values('Date')
+        df = sp500.pe_ratio  # already in date order (SP500 keeps prices sorted)
         if df.empty:
             continue
         
@@ -98,15 +98,15 @@ def plot_time_series(
         (ax2 if i == 1 else ax).plot(dates_vals, val.values, color=colors[i], linewidth=1.5,
                                      label=labels[i], alpha=0.7, zorder=2)
     
-    if sigma is not None and sigma_index < len(values):
+    show_sigma = sigma is not None and sigma_index < len(values)
+    if show_sigma:
         v = values[sigma_index].values
         mean, std = np.mean(v), np.std(v)
         upper, lower = mean + sigma * std, mean - sigma * std
         for mask, color in [(v > upper, 'red'), (v < lower, 'blue')]:
-            starts = np.where(np.diff(np.concatenate(([False], mask, [False]))))[0]
-            for i in range(0, len(starts), 2):
-                if i+1 < len(starts):
-                    ax.axvspan(dates_vals[starts[i]], dates_vals[starts[i+1]-1], alpha=0.2, color=color, zorder=0)
+            # All bands of one color as a single full-height collection (one artist, not one patch per band)
+            ax.fill_between(dates_vals, 0, 1, where=mask, transform=ax.get_xaxis_transform(),
+                            alpha=0.2, color=color, linewidth=0, zorder=0)
         target_ax = ax2 if sigma_index == 1 and ax2 else ax
         for y, style in [(mean, '--'), (upper, ':'), (lower, ':')]:
             target_ax.axhline(y=y, color='gray' if style == '--' else 'gold', linestyle=style, 
@@ -126,10 +126,7 @@ def plot_time_series(
         lines2, lbls2 = ax2.get_legend_handles_labels()
         lines, lbls = lines + lines2, lbls + lbls2
     
-    if sigma is not None and sigma_index < len(values):
-        v = values[sigma_index].values
-        mean, std = np.mean(v), np.std(v)
-        upper, lower = mean + sigma * std, mean - sigma * std
+    if show_sigma:
         lines.extend([
             plt.Line2D([0], [0], color='gray', linestyle='--', linewidth=1.2, label=f'Mean: {mean:.2f}'),
             plt.Line2D([0], [0], color='gold', linestyle=':', linewidth=1.2, label=f'+{sigma}σ: {upper:.2f}'),